@@ -148,6 +148,27 @@ class Bootstrap:
             self.celery_backend = os.getenv("RESULT_BACKEND", "redis://localhost:6379/0")
             self.celery_broker = os.getenv("BROKER_URL", "redis://localhost:6379/0")
             self.celery_friends = self._load_celery_friends()
+            self.celery_profiles = self._load_celery_profiles(self.celery_friends)
+
+    @staticmethod
+    def _load_celery_profiles(friends):
+        from kimera.process.CeleryProfile import CeleryProfile
+        return {name: CeleryProfile(name, friend) for name, friend in friends.items()}
+
+    def celery_worker_app(self, friend, celery_app=None):
+        """
+        Celery app for a friend's worker module, tuned by the friend's `celery:` block in friends.yaml.
+        Pass an existing app to only apply the profile.
+        """
+        if celery_app is None:
+            from celery import Celery
+            celery_app = Celery(broker=self.celery_broker, backend=self.celery_backend)
+        profile = self.celery_profiles.get(friend)
+        if profile is None:
+            from kimera.helpers.Helpers import Helpers
+            Helpers.warnPrint(f"Celery friend {friend} is not in friends.yaml, using default worker settings")
+            return celery_app
+        return profile.apply(celery_app)
 
     def _load_celery_friends(self):
         config_friends = Bootstrap._load_friends_config(f"{self._app_path}/app/config/friends.yaml")
@@ -175,12 +196,12 @@ class Bootstrap:
     def root_path(self):
         return self._app_path
 
-    async def run_intercom(self, channel, callback):
+    async def run_intercom(self, channel, callback, **options):
         from kimera.helpers.Helpers import Helpers
         if self._full_boot:
             Helpers.sysPrint("INTERCOM", "CONNECTED")
         if self.intercom:
-            await self.intercom.subscribe(channel, callback)
+            return await self.intercom.subscribe(channel, callback, **options)
         else:
             if self._full_boot:
                 Helpers.sysPrint("INTERCOM", "OFF")
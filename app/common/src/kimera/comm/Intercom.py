@@ -1,4 +1,8 @@
 import json
+import os
+import weakref
+
+import redis
 import redis.asyncio as aioredis
 import asyncio
 
@@ -6,7 +10,9 @@ from pydantic_core.core_schema import ValidationInfo
 
 
 from pydantic import BaseModel, field_validator
-from typing import Union, Dict
+from typing import Union, Dict, Iterable, List
+
+from kimera.helpers.Helpers import Helpers
 
 
 
@@ -31,6 +37,95 @@ class Message(BaseModel):
         return v
 
 
+class Subscription:
+    """
+    One callback bound to channels (or patterns), fed through a bounded queue and drained
+    by `concurrency` worker tasks, so a slow handler does not hold up other subscriptions
+    while its queue has room.
+
+    policy="block": the listener waits for queue space (backpressure onto the connection).
+    All subscriptions share one listener, so a full queue stalls delivery on every channel
+    until it drains (head-of-line blocking); size the queue for bursts.
+    policy="drop": messages arriving while the queue is full are counted in `dropped` and
+    discarded, and other subscriptions keep flowing.
+    raw=True hands the callback the payload as received (bytes) instead of the decoded content.
+    """
+
+    POLICIES = ("block", "drop")
+
+    def __init__(self, names: List[str], callback, pattern: bool = False, concurrency: int = 1,
+                 queue_size: int = 1000, policy: str = "block", raw: bool = False):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Subscription policy must be one of {self.POLICIES}")
+        self.names = names
+        self.callback = callback
+        self.pattern = pattern
+        self.concurrency = max(1, concurrency)
+        self.policy = policy
+        self.raw = raw
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self._workers = []
+
+    def start(self):
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+
+    async def offer(self, data):
+        if self.policy == "block":
+            await self.queue.put(data)
+            return
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                Helpers.warnPrint(f"Intercom queue full for {self.names}, dropped {self.dropped} messages")
+
+    @staticmethod
+    def decode(data):
+        """Unwrap a published `Message` to its content; anything that is not one is passed through as is."""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        if isinstance(data, str):
+            try:
+                payload = json.loads(data)
+            except ValueError:
+                return data
+            if isinstance(payload, dict) and {"content", "channel"} <= payload.keys():
+                return Message(**payload).content
+            return payload
+        return data
+
+    async def _work(self):
+        while True:
+            data = await self.queue.get()
+            try:
+                await self.callback(data if self.raw else self.decode(data))
+                self.processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                Helpers.errPrint(f"Intercom handler for {self.names} failed: {e}", os.path.basename(__file__))
+            finally:
+                self.queue.task_done()
+
+    async def stop(self, drain: bool = False):
+        """Stop the workers, optionally after the queued messages have been handled."""
+        if drain and self._workers:
+            await self.queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def stats(self) -> Dict[str, int]:
+        return {"queued": self.queue.qsize(), "processed": self.processed,
+                "failed": self.failed, "dropped": self.dropped}
+
+
 class Intercom:
     _instance = None
     _initialized = False
@@ -43,44 +138,136 @@ class Intercom:
             cls._redis_comm_url = redis_comm_url
             cls._redis = aioredis.from_url(redis_comm_url)
             cls._pubsub = cls._redis.pubsub()
+            cls._redis_loop = None
+            cls._loop_clients = weakref.WeakKeyDictionary()
+            cls._sync_redis = None
             cls.channels = {}
+            cls.patterns = {}
+            cls._listener = None
             cls._initialized = True
         return cls._instance
 
-    async def subscribe(self, channel, callback):
+    async def subscribe(self, channel: Union[str, Iterable[str]], callback, pattern: bool = False,
+                        concurrency: int = 1, queue_size: int = 1000, policy: str = "block",
+                        raw: bool = False) -> Subscription:
         """
-        Subscribe to a Redis channel asynchronously and trigger an async callback when a message is received.
+        Subscribe an async callback to one or more channels (or glob patterns with pattern=True).
+        All subscriptions share one pubsub connection and one `pubsub.listen()` task; each gets its
+        own bounded queue and `concurrency` workers. concurrency=1 keeps messages in order.
+        Returns the Subscription, which can be passed to `unsubscribe`.
         """
-        await self._pubsub.subscribe(channel)
+        names = [channel] if isinstance(channel, str) else list(channel)
+        subscription = Subscription(names, callback, pattern=pattern, concurrency=concurrency,
+                                    queue_size=queue_size, policy=policy, raw=raw)
+        subscription.start()
 
-        async def listener():
-            while True:
-                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message:
-                    # Call the callback and await its result
-                    if type(message["data"]) is bytes:
-                        data = Message(**json.loads(message["data"].decode("utf-8")))
-                    else:
-                        await callback(message["data"])
-                        return
-                    if data.type == "json":
-                        data = data.content
+        registry = self.patterns if pattern else self.channels
+        new_names = [name for name in names if name not in registry]
+        for name in names:
+            registry.setdefault(name, []).append(subscription)
+        if new_names:
+            if pattern:
+                await self._pubsub.psubscribe(*new_names)
+            else:
+                await self._pubsub.subscribe(*new_names)
+
+        if self._listener is None or self._listener.done():
+            type(self)._listener = asyncio.create_task(self._listen())
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription, drain: bool = False):
+        """Detach a subscription, dropping the Redis subscription once no callback uses it."""
+        registry = self.patterns if subscription.pattern else self.channels
+        unused = []
+        for name in subscription.names:
+            subscribers = registry.get(name, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                registry.pop(name, None)
+                unused.append(name)
+        if unused:
+            if subscription.pattern:
+                await self._pubsub.punsubscribe(*unused)
+            else:
+                await self._pubsub.unsubscribe(*unused)
+        await subscription.stop(drain=drain)
+
+    async def close(self, drain: bool = False):
+        """Stop the listener and every subscription, then close the pubsub connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            type(self)._listener = None
+        subscriptions = {id(s): s for subs in (*self.channels.values(), *self.patterns.values()) for s in subs}
+        self.channels.clear()
+        self.patterns.clear()
+        await asyncio.gather(*(s.stop(drain=drain) for s in subscriptions.values()))
+        await self._pubsub.aclose()
+
+    async def _listen(self):
+        """Read the shared pubsub connection and hand each message to its subscriptions' queues."""
+        while self.channels or self.patterns:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "pmessage":
+                        subscribers = self.patterns.get(self._name(message["pattern"]), ())
+                    elif message["type"] == "message":
+                        subscribers = self.channels.get(self._name(message["channel"]), ())
                     else:
-                        data = data.content
+                        continue
+                    for subscription in tuple(subscribers):
+                        await subscription.offer(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Helpers.errPrint(f"Intercom listener failed: {e}", os.path.basename(__file__))
+                await asyncio.sleep(1.0)
+            else:
+                # listen() returns once nothing is subscribed
+                break
 
-                    await callback(data)
+    @staticmethod
+    def _name(value) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
 
+    def _client(self) -> aioredis.Redis:
+        """
+        Pooled async client for the running loop. The singleton client is bound to the first
+        loop that uses it; other loops (worker threads, asyncio.run in tasks) get their own.
+        """
+        loop = asyncio.get_running_loop()
+        if self._redis_loop is None:
+            type(self)._redis_loop = loop
+        if loop is self._redis_loop:
+            return self._redis
+        client = self._loop_clients.get(loop)
+        if client is None:
+            client = self._loop_clients[loop] = aioredis.from_url(self._redis_comm_url)
+        return client
 
-        # Run the listener in the background
-        task = asyncio.create_task(listener())
+    @staticmethod
+    def _encode(message: Message) -> str:
+        return message.model_dump_json()
 
     async def publish(self, message: Message):
         """
-        Publish a message to a Redis channel asynchronously.
+        Publish a message to a Redis channel asynchronously, over the shared connection pool.
+        """
+        await self._client().publish(message.channel, self._encode(message))
+
+    async def publish_many(self, messages):
+        """
+        Publish many messages in one round-trip (non-transactional pipeline).
+        Returns the number of subscribers that received each message.
         """
-        redis = await aioredis.from_url(self._redis_comm_url)
-        await redis.publish(message.channel, json.dumps(message.model_dump()))
-        await redis.close()
+        messages = list(messages)
+        if not messages:
+            return []
+        async with self._client().pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.publish(message.channel, self._encode(message))
+            return await pipe.execute()
 
     async def set(self, key, value):
         """
@@ -116,8 +303,25 @@ class Intercom:
         """
         return await self._redis.exists(key) > 0
 
+    def _sync_client(self) -> redis.Redis:
+        if self._sync_redis is None:
+            type(self)._sync_redis = redis.Redis.from_url(self._redis_comm_url)
+        return self._sync_redis
+
     def emit(self, message: Message):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.publish(message=message))  # Non-blocking
-        loop.close()
+        """
+        Publish from synchronous code through a pooled sync client (no event loop needed).
+        """
+        return self._sync_client().publish(message.channel, self._encode(message))
+
+    def emit_many(self, messages):
+        """
+        Synchronous twin of `publish_many`.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+        with self._sync_client().pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.publish(message.channel, self._encode(message))
+            return pipe.execute()
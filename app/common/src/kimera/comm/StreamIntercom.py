@@ -0,0 +1,234 @@
+import asyncio
+import os
+import socket
+from typing import Dict, Iterable, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from kimera.comm.Intercom import Message, Subscription
+from kimera.helpers.Helpers import Helpers
+
+
+class StreamSubscription:
+    """
+    Consumer-group reader for one stream. Entries are acked only after the callback
+    returns, so anything in flight when a worker dies stays pending and is reclaimed
+    (XAUTOCLAIM) by another consumer once idle for `claim_idle_ms`: at-least-once delivery.
+    A reclaimed entry already delivered `max_deliveries` times is acked and moved to the
+    `dead_letter` stream (default `<stream>:dead`) instead of being retried again.
+    raw=True hands the callback the entry's `data` bytes instead of the decoded content.
+    """
+
+    def __init__(self, client: aioredis.Redis, stream: str, callback, group: str, consumer: str,
+                 count: int = 100, block_ms: int = 5000, concurrency: int = 1,
+                 claim_idle_ms: int = 60000, claim_interval: float = 30.0, raw: bool = False,
+                 max_deliveries: Optional[int] = 5, dead_letter: Optional[str] = None,
+                 dead_letter_maxlen: Optional[int] = None):
+        self.client = client
+        self.stream = stream
+        self.callback = callback
+        self.group = group
+        self.consumer = consumer
+        self.count = count
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval
+        self.raw = raw
+        self.max_deliveries = max_deliveries
+        self.dead_letter = dead_letter or f"{stream}:dead"
+        self.dead_letter_maxlen = dead_letter_maxlen
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._task = None
+        self._stopping = asyncio.Event()
+        self.processed = 0
+        self.failed = 0
+        self.reclaimed = 0
+        self.dead = 0
+
+    async def start(self):
+        try:
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._task = asyncio.create_task(self._consume())
+
+    async def stop(self, timeout: Optional[float] = None):
+        """
+        Let the current batch finish and get acked (bounded by one XREADGROUP block plus
+        `timeout`), then cancel. Entries cut off by the cancel stay pending for reclaim.
+        """
+        if self._task is None:
+            return
+        self._stopping.set()
+        timeout = self.block_ms / 1000 + 1.0 if timeout is None else timeout
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"processed": self.processed, "failed": self.failed, "reclaimed": self.reclaimed, "dead": self.dead}
+
+    async def _handle(self, entry_id, fields) -> Optional[bytes]:
+        async with self._semaphore:
+            try:
+                data = fields.get(b"data")
+                await self.callback(data if self.raw else Subscription.decode(data))
+                self.processed += 1
+                return entry_id
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Left pending: retried when reclaimed
+                self.failed += 1
+                Helpers.errPrint(f"Stream handler for {self.stream} failed on {entry_id}: {e}",
+                                 os.path.basename(__file__))
+                return None
+
+    async def _process(self, entries):
+        # Trimmed entries come back from XAUTOCLAIM as (id, None)
+        results = await asyncio.gather(*(self._handle(entry_id, fields) for entry_id, fields in entries if fields))
+        acked = [entry_id for entry_id in results if entry_id is not None]
+        acked += [entry_id for entry_id, fields in entries if not fields]
+        if acked:
+            await self.client.xack(self.stream, self.group, *acked)
+
+    async def _bury(self, entries):
+        """
+        Split reclaimed entries into those to retry and those past `max_deliveries`;
+        the latter are copied to the dead-letter stream and acked.
+        """
+        if not self.max_deliveries:
+            return entries
+        async with self.client.pipeline(transaction=False) as pipe:
+            for entry_id, _ in entries:
+                pipe.xpending_range(self.stream, self.group, min=entry_id, max=entry_id, count=1)
+            pending = await pipe.execute()
+
+        retry, dead = [], []
+        for (entry_id, fields), info in zip(entries, pending):
+            deliveries = info[0]["times_delivered"] if info else 0
+            if fields and deliveries > self.max_deliveries:
+                dead.append((entry_id, fields, deliveries))
+            else:
+                retry.append((entry_id, fields))
+        if not dead:
+            return retry
+
+        trim = {"maxlen": self.dead_letter_maxlen, "approximate": True} if self.dead_letter_maxlen else {}
+        async with self.client.pipeline(transaction=False) as pipe:
+            for entry_id, fields, deliveries in dead:
+                pipe.xadd(self.dead_letter, {**fields, b"id": entry_id, b"group": self.group,
+                                             b"deliveries": deliveries}, **trim)
+            pipe.xack(self.stream, self.group, *(entry_id for entry_id, _, _ in dead))
+            await pipe.execute()
+        self.dead += len(dead)
+        for entry_id, _, deliveries in dead:
+            Helpers.errPrint(f"Stream entry {entry_id} of {self.stream} failed {deliveries - 1} deliveries, "
+                             f"moved to {self.dead_letter}", os.path.basename(__file__))
+        return retry
+
+    async def _reclaim(self):
+        start = "0-0"
+        while True:
+            reply = await self.client.xautoclaim(self.stream, self.group, self.consumer,
+                                                 min_idle_time=self.claim_idle_ms, start_id=start, count=self.count)
+            start, entries = reply[0], reply[1]
+            if entries:
+                self.reclaimed += len(entries)
+                entries = await self._bury(entries)
+                await self._process(entries)
+            # Pages can come back empty mid-scan (deleted entries); only the cursor says we are done
+            if start in (b"0-0", "0-0"):
+                return
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        next_claim = 0.0
+        while not self._stopping.is_set():
+            try:
+                if loop.time() >= next_claim:
+                    await self._reclaim()
+                    next_claim = loop.time() + self.claim_interval
+
+                reply = await self.client.xreadgroup(self.group, self.consumer, {self.stream: ">"},
+                                                     count=self.count, block=self.block_ms)
+                for _, entries in reply or ():
+                    await self._process(entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Helpers.errPrint(f"Stream consumer for {self.stream} failed: {e}", os.path.basename(__file__))
+                await asyncio.sleep(1.0)
+
+
+class StreamIntercom:
+    """
+    Intercom transport on Redis Streams: durable, load-balanced across a consumer group.
+    Producers XADD `Message`s to the stream named by `message.channel` (trimmed to about
+    `maxlen` entries); consumers read in batches with XREADGROUP and XACK after handling.
+    """
+
+    def __init__(self, redis_url: str, maxlen: Optional[int] = 100000, max_connections: Optional[int] = None):
+        self.redis_url = redis_url
+        self.maxlen = maxlen
+        self._redis = aioredis.from_url(redis_url, max_connections=max_connections)
+        self._sync_redis = None
+        self.subscriptions: List[StreamSubscription] = []
+
+    def _xadd_kwargs(self) -> dict:
+        return {"maxlen": self.maxlen, "approximate": True} if self.maxlen else {}
+
+    @staticmethod
+    def _fields(message: Message) -> dict:
+        return {"data": message.model_dump_json()}
+
+    async def publish(self, message: Message):
+        """Append a message to its stream and return the entry id."""
+        return await self._redis.xadd(message.channel, self._fields(message), **self._xadd_kwargs())
+
+    async def publish_many(self, messages: Iterable[Message]):
+        """Append many messages in one round-trip."""
+        messages = list(messages)
+        if not messages:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.xadd(message.channel, self._fields(message), **self._xadd_kwargs())
+            return await pipe.execute()
+
+    def emit(self, message: Message):
+        """Synchronous `publish` through a pooled sync client."""
+        if self._sync_redis is None:
+            self._sync_redis = redis.Redis.from_url(self.redis_url)
+        return self._sync_redis.xadd(message.channel, self._fields(message), **self._xadd_kwargs())
+
+    async def subscribe(self, channel: str, callback, group: str, consumer: Optional[str] = None,
+                        count: int = 100, block_ms: int = 5000, concurrency: int = 1,
+                        claim_idle_ms: int = 60000, claim_interval: float = 30.0,
+                        raw: bool = False, max_deliveries: Optional[int] = 5,
+                        dead_letter: Optional[str] = None) -> StreamSubscription:
+        """
+        Consume a stream as `consumer` of consumer group `group` (created if missing).
+        Every process in the group gets a share of the entries; the consumer name
+        defaults to <hostname>-<pid>. Entries that keep failing go to `dead_letter`
+        (default `<channel>:dead`) after `max_deliveries` attempts; None retries forever.
+        """
+        consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        subscription = StreamSubscription(self._redis, channel, callback, group, consumer, count=count,
+                                          block_ms=block_ms, concurrency=concurrency,
+                                          claim_idle_ms=claim_idle_ms, claim_interval=claim_interval, raw=raw,
+                                          max_deliveries=max_deliveries, dead_letter=dead_letter,
+                                          dead_letter_maxlen=self.maxlen)
+        await subscription.start()
+        self.subscriptions.append(subscription)
+        return subscription
+
+    async def close(self):
+        await asyncio.gather(*(s.stop() for s in self.subscriptions))
+        self.subscriptions = []
+        await self._redis.aclose()
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Any, Optional, Sequence
+import datetime
+import decimal
+import uuid
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence
 
 
 from kimera.store.StoreFactory import StoreFactory
@@ -18,6 +21,9 @@ class AutoWireRepo:
     model_name: str = None        # set in subclass, e.g., "operators"
     store_name: str = "default"   # override if needed
 
+    # (model, excluded columns) -> row serializer, shared across repo instances
+    _serializers: dict = {}
+
     def __init__(self):
         if not self.model_name:
             raise TypeError("Subclasses must set `model_name` to the mapped SQLAlchemy class name.")
@@ -61,6 +67,137 @@ class AutoWireRepo:
             result = await session.execute(select(self.model))
             return list(result.scalars().all())
 
+    # ---------- Projection (plain rows, no ORM objects) ----------
+
+    def _columns(self, columns: Optional[Iterable[str]]):
+        table = self.model.__table__
+        if not columns:
+            return list(table.columns)
+        try:
+            return [table.c[name] for name in columns]
+        except KeyError as e:
+            raise AttributeError(f"Column {e} not found on '{self.model_name}'.") from None
+
+    async def select(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        mappings: bool = True,
+        limit: Optional[int] = None,
+        **filters: Any
+    ) -> list[Any]:
+        """
+        Select only `columns` (all when None) of matching rows, bypassing the ORM identity map.
+        Returns dicts when `mappings` is True, otherwise lightweight Row tuples.
+        """
+        from sqlalchemy import select as sa_select
+        self._require_model()
+        stmt = sa_select(*self._columns(columns)).filter_by(**filters)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        async with self.db.session() as session:
+            result = await session.execute(stmt)
+            if mappings:
+                return [dict(m) for m in result.mappings()]
+            return list(result.all())
+
+    async def select_one(self, columns: Optional[Iterable[str]] = None, mappings: bool = True, **filters: Any) -> Optional[Any]:
+        """First matching row of a projection, or None."""
+        rows = await self.select(columns=columns, mappings=mappings, limit=1, **filters)
+        return rows[0] if rows else None
+
+    @staticmethod
+    def _converter(column) -> Optional[Callable[[Any], Any]]:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return None
+        if issubclass(python_type, (datetime.date, datetime.time)):
+            return lambda v: v.isoformat()
+        if issubclass(python_type, decimal.Decimal):
+            return float
+        if issubclass(python_type, uuid.UUID):
+            return str
+        return None
+
+    def serializer(self, exclude: Iterable[str] = ()) -> Callable[[Any], dict[str, Any]]:
+        """
+        JSON-safe row serializer for this model, built once per (model, exclude) and cached.
+        Converters are resolved from column types up front, so serializing a row
+        is a single pass without per-value type checks. Accepts mappings or ORM objects.
+        """
+        self._require_model()
+        skip = frozenset(exclude)
+        key = (self.model, skip)
+        cached = AutoWireRepo._serializers.get(key)
+        if cached is not None:
+            return cached
+
+        columns = [c for c in self.model.__table__.columns if c.name not in skip]
+        converters = {c.name: self._converter(c) for c in columns}
+        converters = {name: fn for name, fn in converters.items() if fn is not None}
+        names = tuple(c.name for c in columns)
+
+        def serialize(row: Any) -> dict[str, Any]:
+            if not hasattr(row, "items"):
+                row = {name: getattr(row, name) for name in names}
+            out = {}
+            for name, value in row.items():
+                if name in skip:
+                    continue
+                fn = converters.get(name)
+                out[name] = fn(value) if fn is not None and value is not None else value
+            return out
+
+        AutoWireRepo._serializers[key] = serialize
+        return serialize
+
+    # ---------- Streaming / pagination (plain row mappings, no ORM objects) ----------
+
+    def _keyset_column(self):
+        pk = list(self.model.__table__.primary_key.columns)
+        if len(pk) != 1:
+            raise TypeError(f"Keyset pagination needs a single-column primary key on '{self.model_name}'.")
+        return pk[0]
+
+    async def page(self, after: Any = None, limit: int = 100, **filters: Any) -> tuple[list[dict[str, Any]], Any]:
+        """
+        Keyset-paginated read ordered by primary key.
+        Returns (rows, next_cursor); next_cursor is None on the last page.
+        """
+        from sqlalchemy import select
+        if limit < 1:
+            raise ValueError(f"page limit must be at least 1, got {limit}")
+        self._require_model()
+        pk = self._keyset_column()
+        stmt = select(self.model.__table__).filter_by(**filters).order_by(pk).limit(limit)
+        if after is not None:
+            stmt = stmt.where(pk > after)
+        async with self.db.session() as session:
+            result = await session.execute(stmt)
+            rows = [dict(m) for m in result.mappings()]
+        next_cursor = rows[-1][pk.name] if rows and len(rows) == limit else None
+        return rows, next_cursor
+
+    async def iter_pages(self, page_size: int = 1000, **filters: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate all matching rows page by page (one short query per page, no long-lived cursor)."""
+        after = None
+        while True:
+            rows, after = await self.page(after=after, limit=page_size, **filters)
+            for row in rows:
+                yield row
+            if after is None:
+                break
+
+    async def stream(self, batch_size: int = 1000, **filters: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate all matching rows through a server-side cursor, fetching `batch_size` rows at a time."""
+        from sqlalchemy import select
+        self._require_model()
+        stmt = select(self.model.__table__).filter_by(**filters).execution_options(yield_per=batch_size)
+        async with self.db._engine.connect() as conn:
+            result = await conn.stream(stmt)
+            async for row in result.mappings():
+                yield dict(row)
+
     async def get(self, id: Any) -> Optional[Any]:
         self._require_model()
         async with self.db.session() as session:
@@ -105,12 +242,107 @@ class AutoWireRepo:
                 await session.delete(obj)
             return True
 
-    async def create_many(self, rows: Sequence[dict[str, Any]]) -> list[Any]:
+    async def create_many(self, rows: Sequence[dict[str, Any]], chunk_size: int = 1000) -> list[Any]:
+        """
+        Insert rows and return the created ORM objects.
+        Uses INSERT .. RETURNING per chunk instead of refreshing every object.
+        """
+        from sqlalchemy import insert
         self._require_model()
+        objs: list[Any] = []
+        if not rows:
+            return objs
         async with self.db.session() as session:
             async with session.begin():
-                objs = [self.model(**row) for row in rows]
-                session.add_all(objs)
-            for obj in objs:
-                await session.refresh(obj)
+                for chunk in self._chunks(rows, chunk_size):
+                    result = await session.scalars(
+                        insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                        chunk
+                    )
+                    objs.extend(result.all())
             return objs
+
+    async def bulk_insert(
+        self,
+        rows: Sequence[dict[str, Any]],
+        chunk_size: int = 5000,
+        returning: Optional[str] = "pk",
+        use_copy: bool = False,
+    ) -> list[Any] | int:
+        """
+        Insert large batches through Core, skipping ORM materialization entirely.
+
+        - returning="pk": list of primary keys (tuples for composite keys)
+        - returning="rows": list of row mappings (dicts)
+        - returning=None: number of inserted rows
+        - use_copy=True: stream through asyncpg COPY (requires returning=None)
+
+        All chunks run in one transaction.
+        """
+        from sqlalchemy import insert
+        self._require_model()
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        if returning not in ("pk", "rows", None):
+            raise ValueError("returning must be 'pk', 'rows' or None")
+        if use_copy and returning is not None:
+            raise ValueError("COPY cannot return rows; use returning=None with use_copy=True")
+        if not rows:
+            return 0 if returning is None else []
+
+        table = self.model.__table__
+        if use_copy:
+            return await self._copy_records(table, rows, chunk_size)
+
+        if returning == "pk":
+            cols = list(table.primary_key.columns)
+        else:
+            cols = list(table.columns)
+
+        out: list[Any] = []
+        count = 0
+        async with self.db.session() as session:
+            async with session.begin():
+                for chunk in self._chunks(rows, chunk_size):
+                    if returning is None:
+                        await session.execute(insert(table), chunk)
+                        count += len(chunk)
+                        continue
+                    result = await session.execute(
+                        insert(table).returning(*cols, sort_by_parameter_order=True),
+                        chunk
+                    )
+                    if returning == "rows":
+                        out.extend(dict(m) for m in result.mappings())
+                    elif len(cols) == 1:
+                        out.extend(result.scalars())
+                    else:
+                        out.extend(tuple(r) for r in result)
+        return count if returning is None else out
+
+    async def _copy_records(self, table, rows: Sequence[dict[str, Any]], chunk_size: int) -> int:
+        """asyncpg COPY FROM STDIN path; columns are taken from the first row."""
+        columns = list(rows[0].keys())
+        count = 0
+        async with self.db._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if not hasattr(driver, "copy_records_to_table"):
+                raise RuntimeError("use_copy requires the asyncpg driver")
+            async with driver.transaction():
+                for chunk in self._chunks(rows, chunk_size):
+                    records = [tuple(row.get(c) for c in columns) for row in chunk]
+                    await driver.copy_records_to_table(
+                        table.name,
+                        records=records,
+                        columns=columns,
+                        schema_name=table.schema
+                    )
+                    count += len(records)
+        return count
+
+    @staticmethod
+    def _chunks(rows: Sequence[dict[str, Any]], size: int):
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        size = max(1, size)
+        for i in range(0, len(rows), size):
+            yield rows[i:i + size]
@@ -1,5 +1,9 @@
 import os
 import asyncio
+import hashlib
+import pickle
+import threading
+import weakref
 
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
@@ -14,37 +18,99 @@ from kimera.helpers.Helpers import Helpers
 
 
 class Database:
-    def __init__(self, uri=None, connection_name='default', **kwargs):
+    # Reflected (metadata, automap Base) shared by every Database in the process,
+    # keyed by (uri, reflected tables). The thread lock only guards the dicts, never I/O:
+    # reflection runs in a greenlet on the event-loop thread, so blocking there would deadlock.
+    _reflections = {}
+    _reflection_lock = threading.Lock()
+    # loop -> {reflection key: asyncio.Lock}, so one coroutine per loop reflects a schema
+    _reflection_guards = weakref.WeakKeyDictionary()
+    # Bumped by clear_reflection_cache(); connect() re-reflects instances reflected before it
+    _reflection_generation = 0
+
+    def __init__(self, uri=None, connection_name='default', reflect_tables=None, reflection_snapshot=None,
+                 pool_size=50, max_overflow=10, pool_timeout=30, pool_recycle=-1, pool_pre_ping=False,
+                 echo=False, **kwargs):
         self.uri = uri
         self.connection_name = connection_name
+        # Engine/pool options, overridable through the store's kwargs in stores.yaml
+        self.engine_options = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            echo=echo
+        )
+        # Optional subset of tables to reflect (referenced tables are pulled in automatically)
+        self.reflect_tables = sorted(reflect_tables) if reflect_tables else None
+        # Optional directory for on-disk metadata snapshots keyed by schema hash
+        self.reflection_snapshot = reflection_snapshot or os.getenv("DB_REFLECTION_SNAPSHOT")
 
         self._engine = None
         self._session = None
         self._metadata = None
         self._Base = None
         self._inspector = None
+        self._reflected_generation = None
         self._connected = False
+        self._loop = None
+        self._connect_lock = None
 
     async def connect(self, db=None):
-        try:
+        """
+        Create the engine on first use and return the connection status.
+        Idempotent: later calls reuse the existing engine and pool unless `db`
+        changes the target database or the caller runs on a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._connect_lock is None or self._loop is not loop:
+            # asyncio locks and async pools are bound to the loop that uses them
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
             if db:
                 parts = self.uri.split("/")
                 if len(parts) > 3:
                     parts[3] = db
-                    self.uri = "/".join(parts)
+                    new_uri = "/".join(parts)
                 else:
-                    self.uri += f"/{db}"
-            self._engine = create_async_engine(
-                self.uri,
-                pool_size=50,
-                max_overflow=10,
-                future=True,
-                echo=False
-            )
+                    new_uri = self.uri + f"/{db}"
+                if new_uri != self.uri:
+                    await self.close()
+                    self.uri = new_uri
+
+            if self._engine is not None and self._loop is not loop:
+                # Connections of the old pool belong to another loop, drop them without awaiting
+                self._engine.sync_engine.dispose(close=False)
+                self._engine = None
+                self._connected = False
+
+            if self._connected and self._engine is not None:
+                if self._reflected_generation != Database._reflection_generation:
+                    # clear_reflection_cache() ran since this instance reflected
+                    try:
+                        async with self._engine.begin() as conn:
+                            await self._reflect(conn, loop)
+                    except Exception as e:
+                        Helpers.errPrint(e, os.path.basename(__file__))
+                return True
+
+            return await self._connect(loop)
+
+    async def _connect(self, loop):
+        try:
+            if self._engine is None:
+                self._engine = create_async_engine(
+                    self.uri,
+                    future=True,
+                    **self.engine_options
+                )
+                self._loop = loop
 
             async with self._engine.begin() as conn:
                 # Prepare metadata, automap, and inspector
-                await conn.run_sync(self._sync_reflection)
+                await self._reflect(conn, loop)
 
                 # Test connection
                 result = await conn.execute(text("SELECT 1"))
@@ -64,17 +130,106 @@ class Database:
             Helpers.errPrint(e, os.path.basename(__file__))
         return self._connected
 
+    async def _reflect(self, conn, loop):
+        generation = Database._reflection_generation
+        async with self._reflection_guard(loop):
+            await conn.run_sync(self._sync_reflection)
+        self._reflected_generation = generation
+
+    def _reflection_key(self):
+        return self.uri, tuple(self.reflect_tables) if self.reflect_tables else None
+
+    def _reflection_guard(self, loop) -> asyncio.Lock:
+        with Database._reflection_lock:
+            guards = Database._reflection_guards.setdefault(loop, {})
+            return guards.setdefault(self._reflection_key(), asyncio.Lock())
+
     def _sync_reflection(self, sync_conn):
-        metadata = MetaData()
-        metadata.reflect(bind=sync_conn)
+        key = self._reflection_key()
 
-        Base = automap_base(metadata=metadata)
-        Base.prepare()
+        with Database._reflection_lock:
+            reflected = Database._reflections.get(key)
 
-        self._metadata = metadata
-        self._Base = Base
+        if reflected is None:
+            snapshot = self._snapshot_path(sync_conn) if self.reflection_snapshot else None
+            metadata = self._load_snapshot(snapshot) if snapshot else None
+            if metadata is None:
+                metadata = MetaData()
+                metadata.reflect(bind=sync_conn, only=self.reflect_tables)
+                if snapshot:
+                    self._save_snapshot(snapshot, metadata)
+
+            Base = automap_base(metadata=metadata)
+            Base.prepare()
+            # Another loop/thread may have reflected the same schema meanwhile; keep the first
+            with Database._reflection_lock:
+                reflected = Database._reflections.setdefault(key, (metadata, Base))
+
+        self._metadata, self._Base = reflected
         self._inspector = inspect(sync_conn)
 
+    def _schema_hash(self, sync_conn) -> str:
+        """Cheap fingerprint of the current schema's columns and constraints."""
+        columns = sync_conn.execute(text(
+            "SELECT table_name, column_name, data_type, is_nullable, column_default "
+            "FROM information_schema.columns WHERE table_schema = current_schema() "
+            "ORDER BY table_name, ordinal_position"
+        )).fetchall()
+        constraints = sync_conn.execute(text(
+            "SELECT table_name, constraint_name, constraint_type "
+            "FROM information_schema.table_constraints WHERE table_schema = current_schema() "
+            "ORDER BY table_name, constraint_name"
+        )).fetchall()
+
+        digest = hashlib.sha256()
+        digest.update(repr(self.reflect_tables).encode("utf-8"))
+        for row in columns:
+            digest.update(repr(tuple(row)).encode("utf-8"))
+        for row in constraints:
+            digest.update(repr(tuple(row)).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _snapshot_path(self, sync_conn):
+        try:
+            # Savepoint so a failing catalog query does not abort the reflection transaction
+            with sync_conn.begin_nested():
+                schema_hash = self._schema_hash(sync_conn)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to hash schema for reflection snapshot: {e}", os.path.basename(__file__))
+            return None
+        return os.path.join(self.reflection_snapshot, f"{self.connection_name}-{schema_hash}.pickle")
+
+    @staticmethod
+    def _load_snapshot(path):
+        try:
+            if not os.path.isfile(path):
+                return None
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to load reflection snapshot: {e}", os.path.basename(__file__))
+            return None
+
+    def _save_snapshot(self, path, metadata):
+        try:
+            os.makedirs(self.reflection_snapshot, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(metadata, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to save reflection snapshot: {e}", os.path.basename(__file__))
+
+    @classmethod
+    def clear_reflection_cache(cls):
+        """
+        Forget reflected schemas so the next connect() reflects again (e.g. after migrations),
+        including on instances that are already connected.
+        """
+        with cls._reflection_lock:
+            cls._reflections.clear()
+            cls._reflection_generation += 1
+
     async def exec(self, sql: str):
         async with self._engine.begin() as conn:
             try:
@@ -118,6 +273,22 @@ class Database:
     async def close(self):
         if self._engine:
             await self._engine.dispose()
+        self._engine = None
+        self._session = None
+        self._connected = False
+
+    def pool_status(self) -> dict:
+        """Snapshot of the engine's connection pool."""
+        if self._engine is None:
+            return {"connected": False}
+        pool = self._engine.sync_engine.pool
+        stats = {"connected": self._connected, "pool": type(pool).__name__}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            fn = getattr(pool, name, None)
+            if callable(fn):
+                stats[name] = fn()
+        stats["status"] = pool.status()
+        return stats
 
     @property
     def session(self):
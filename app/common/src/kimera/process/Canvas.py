@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+# Worker-side link task used by TaskManager canvases
+MERGE_TASK = "kimera.process.Canvas.merge"
+
+
+def merge_result(result: Any, args: Optional[List] = None, kwargs: Optional[Dict[str, Any]] = None) -> Tuple[List, Dict[str, Any]]:
+    """
+    TaskManager's result-merging rules: a dict result updates kwargs, a list extends
+    args, anything else becomes kwargs["payload"].
+    """
+    args = list(args or [])
+    kwargs = dict(kwargs or {})
+    if isinstance(result, dict):
+        kwargs.update(result)
+    elif isinstance(result, list):
+        args.extend(result)
+    else:
+        kwargs["payload"] = result
+    return args, kwargs
+
+
+def register_canvas_tasks(celery_app):
+    """
+    Register the link task on a worker's Celery app. Every friend that can be the
+    second-or-later step of a TaskManager chain, or a chord body, must call this.
+
+    In a chain the link task receives the previous result, merges it into the next
+    task's args/kwargs and replaces itself with that task, so results flow from
+    worker to worker without going back to the caller.
+    """
+
+    @celery_app.task(name=MERGE_TASK, bind=True)
+    def merge(self, result, task: str, args=None, kwargs=None, queue: Optional[str] = None,
+              options: Optional[Dict[str, Any]] = None):
+        args, kwargs = merge_result(result, args, kwargs)
+        # The friend's send options (time limits, priority, ...) apply to the real task too
+        return self.replace(self.app.signature(task, args=args, kwargs=kwargs, queue=queue, **(options or {})))
+
+    return merge
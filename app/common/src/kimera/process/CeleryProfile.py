@@ -0,0 +1,132 @@
+from typing import Any, Dict, Optional
+
+
+class CeleryProfile:
+    """
+    Per-friend Celery tuning, read from the friend's `celery:` block in friends.yaml.
+
+        friends:
+          notifications:
+            route: app.src.background.notifications
+            queue: notifications_q
+            celery:
+              pool: threads              # prefork | threads | gevent | eventlet | solo
+              concurrency: 8
+              prefetch_multiplier: 1
+              acks_late: true
+              result_expires: 3600       # seconds
+              serializer: json           # json | msgpack | pickle | yaml
+              compression: gzip          # gzip | bzip2 | zstd | brotli ...
+              time_limit: 120            # hard limit, seconds
+              soft_time_limit: 100
+              priority_levels: 10        # enables priority queues (0 .. levels-1)
+              default_priority: 5        # Redis: 0 runs first; AMQP: levels-1 runs first
+
+    `apply(celery_app)` configures the friend's worker app; `send_options()` holds the
+    per-message options the client side (TaskManager) sends with every task.
+    """
+
+    POOLS = ("prefork", "threads", "gevent", "eventlet", "solo")
+
+    def __init__(self, name: str, friend: Optional[Dict[str, Any]] = None):
+        friend = friend or {}
+        options = friend.get("celery") or {}
+        self.name = name
+        self.queue = friend.get("queue")
+        self.options = dict(options)
+
+        pool = options.get("pool")
+        if pool is not None and pool not in self.POOLS:
+            raise ValueError(f"Unknown Celery pool '{pool}' for friend {name}, expected one of {self.POOLS}")
+
+    def worker_conf(self) -> Dict[str, Any]:
+        """Celery settings for the friend's worker app."""
+        o = self.options
+        conf: Dict[str, Any] = {}
+
+        if self.queue:
+            conf["task_default_queue"] = self.queue
+        if "pool" in o:
+            conf["worker_pool"] = o["pool"]
+        if "concurrency" in o:
+            conf["worker_concurrency"] = int(o["concurrency"])
+        if "prefetch_multiplier" in o:
+            conf["worker_prefetch_multiplier"] = int(o["prefetch_multiplier"])
+        if "acks_late" in o:
+            conf["task_acks_late"] = bool(o["acks_late"])
+            # With late acks, a task whose worker process dies is redelivered instead of lost
+            conf["task_reject_on_worker_lost"] = bool(o["acks_late"])
+        if "result_expires" in o:
+            conf["result_expires"] = int(o["result_expires"])
+        if "serializer" in o:
+            conf["task_serializer"] = o["serializer"]
+            conf["result_serializer"] = o["serializer"]
+            conf["accept_content"] = sorted({o["serializer"], "json"})
+            conf["result_accept_content"] = conf["accept_content"]
+        if "compression" in o:
+            conf["task_compression"] = o["compression"]
+            conf["result_compression"] = o["compression"]
+        if "time_limit" in o:
+            conf["task_time_limit"] = int(o["time_limit"])
+        if "soft_time_limit" in o:
+            conf["task_soft_time_limit"] = int(o["soft_time_limit"])
+        conf.update(self._priority_conf())
+        return conf
+
+    def _priority_conf(self) -> Dict[str, Any]:
+        levels = self.options.get("priority_levels")
+        if not levels:
+            return {}
+        levels = int(levels)
+        conf = {
+            # AMQP brokers: declare queues with x-max-priority
+            "task_queue_max_priority": levels - 1,
+            # Redis broker: one list per priority step, consumed highest priority first
+            "broker_transport_options": {
+                "priority_steps": list(range(levels)),
+                "queue_order_strategy": "priority",
+            },
+        }
+        if "default_priority" in self.options:
+            conf["task_default_priority"] = int(self.options["default_priority"])
+        return conf
+
+    def send_options(self) -> Dict[str, Any]:
+        """Per-message options for send_task/signatures, so the client side matches the worker."""
+        o = self.options
+        options: Dict[str, Any] = {}
+        if "serializer" in o:
+            options["serializer"] = o["serializer"]
+        if "compression" in o:
+            options["compression"] = o["compression"]
+        if "time_limit" in o:
+            options["time_limit"] = int(o["time_limit"])
+        if "soft_time_limit" in o:
+            options["soft_time_limit"] = int(o["soft_time_limit"])
+        if o.get("priority_levels") and "default_priority" in o:
+            options["priority"] = int(o["default_priority"])
+        return options
+
+    @staticmethod
+    def client_conf(profiles) -> Dict[str, Any]:
+        """
+        Settings for a client app that talks to all these friends: accept every result
+        serializer they use, and know the largest priority range so a Redis broker
+        routes prioritised messages to the right lists.
+        """
+        conf: Dict[str, Any] = {}
+        serializers = {p.options["serializer"] for p in profiles if "serializer" in p.options}
+        if serializers:
+            conf["result_accept_content"] = sorted(serializers | {"json"})
+        levels = max((int(p.options.get("priority_levels") or 0) for p in profiles), default=0)
+        if levels:
+            conf["broker_transport_options"] = {
+                "priority_steps": list(range(levels)),
+                "queue_order_strategy": "priority",
+            }
+        return conf
+
+    def apply(self, celery_app):
+        """Apply the worker settings to a friend's Celery app and return it."""
+        celery_app.conf.update(self.worker_conf())
+        return celery_app
@@ -0,0 +1,125 @@
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from kimera.helpers.Helpers import Helpers
+
+
+class ResultListener:
+    """
+    Push-based task results for one event loop, on the Redis result backend.
+
+    Celery's Redis backend PUBLISHes every state change on the result key's channel.
+    One pubsub connection per loop subscribes to the channels of the tasks being awaited
+    (and to a private keep-alive channel, so the reader never runs out of subscriptions).
+    Each waiter also GETs the key right after subscribing, so results stored before the
+    subscription are not missed. Futures resolve on SUCCESS and fail on FAILURE/REVOKED.
+    """
+
+    READY_STATES = ("SUCCESS", "FAILURE", "REVOKED")
+
+    def __init__(self, backend, url: str):
+        import redis.asyncio as aioredis
+
+        self.backend = backend
+        self._redis = aioredis.from_url(url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._keys: Dict[bytes, str] = {}
+        self._refs: Dict[str, int] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._keepalive = f"kimera:results:{os.getpid()}:{id(self)}"
+
+    @staticmethod
+    def supports(url: Optional[str]) -> bool:
+        return bool(url) and url.startswith(("redis://", "rediss://", "unix://"))
+
+    def _key(self, task_id: str) -> bytes:
+        key = self.backend.get_key_for_task(task_id)
+        return key if isinstance(key, bytes) else key.encode("utf-8")
+
+    async def _ensure_reader(self):
+        if self._reader is None or self._reader.done():
+            await self._pubsub.subscribe(self._keepalive)
+            self._reader = asyncio.create_task(self._read())
+
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a task's result. Raises the task's exception on failure and
+        asyncio.TimeoutError once `timeout` seconds have passed. Waiters on the same task
+        share one subscription, which is dropped when the last of them leaves.
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(task_id)
+        future = self._waiters.get(task_id)
+        first = future is None
+        if first:
+            future = self._waiters[task_id] = loop.create_future()
+            self._keys[key] = task_id
+        self._refs[task_id] = self._refs.get(task_id, 0) + 1
+
+        try:
+            if first:
+                await self._ensure_reader()
+                await self._pubsub.subscribe(key)
+                # The task may have finished before we subscribed
+                self._resolve(task_id, await self._redis.get(key))
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            self._refs[task_id] -= 1
+            if not self._refs[task_id]:
+                del self._refs[task_id]
+                self._waiters.pop(task_id, None)
+                self._keys.pop(key, None)
+                try:
+                    await self._pubsub.unsubscribe(key)
+                except Exception:
+                    pass
+
+    def _resolve(self, task_id: Optional[str], payload):
+        future = self._waiters.get(task_id) if task_id else None
+        if future is None or future.done() or payload is None:
+            return
+        try:
+            meta = self.backend.decode_result(payload)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        status = meta.get("status")
+        if status not in self.READY_STATES:
+            return
+        if status == "SUCCESS":
+            future.set_result(meta.get("result"))
+        else:
+            future.set_exception(self.backend.exception_to_python(meta.get("result")))
+
+    async def _read(self):
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        channel = message["channel"]
+                        channel = channel if isinstance(channel, bytes) else channel.encode("utf-8")
+                        self._resolve(self._keys.get(channel), message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                Helpers.errPrint(f"Result listener failed: {e}", os.path.basename(__file__))
+                await asyncio.sleep(1.0)
+                # Results published while disconnected were missed, re-check every waiter
+                for key, task_id in list(self._keys.items()):
+                    try:
+                        self._resolve(task_id, await self._redis.get(key))
+                    except Exception:
+                        break
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        for future in self._waiters.values():
+            if not future.done():
+                future.cancel()
+        await self._pubsub.aclose()
+        await self._redis.aclose()
@@ -1,5 +1,6 @@
-from typing import Any, TypeVar, Dict, List, Optional, Callable
-from functools import partial
+import os
+import weakref
+from typing import Any, TypeVar, Dict, Iterable, List, Optional, Callable
 
 T = TypeVar('T')
 
@@ -9,45 +10,128 @@ class TimeoutException(Exception):
 
 
 class TaskParams:
+    """
+    Celery task invocation. Plain `__slots__` object with cheap type checks, so large
+    fan-outs can build thousands of them (see `many`).
+    """
+
+    __slots__ = ("friend", "task_name", "callback", "args", "kwargs", "timeout")
+
     def __init__(
         self,
         friend: str,
         task_name: str,
         callback: Optional[Callable] = None,
-        args: Optional[List[str]] = None,
+        args: Optional[List[Any]] = None,
         kwargs: Optional[Dict[str, Any]] = None,
         timeout: int = 30,
     ):
-        from pydantic import BaseModel
-
-        class _TaskModel(BaseModel):
-            friend: str
-            task_name: str
-            callback: Optional[Callable]
-            args: Optional[List[str]]
-            kwargs: Optional[Dict[str, Any]]
-            timeout: int
-
-        # Validate using Pydantic, but don't subclass to keep it lazy
-        validated = _TaskModel(
-            friend=friend,
-            task_name=task_name,
-            callback=callback,
-            args=args,
-            kwargs=kwargs,
-            timeout=timeout
-        )
+        self._check_shared(friend, task_name, callback, timeout)
+        self.friend = friend
+        self.task_name = task_name
+        self.callback = callback
+        self.args = self._check_args(args)
+        self.kwargs = self._check_kwargs(kwargs)
+        self.timeout = int(timeout)
+
+    @staticmethod
+    def _check_shared(friend, task_name, callback, timeout):
+        if not isinstance(friend, str):
+            raise TypeError(f"TaskParams.friend must be a str, got {type(friend).__name__}")
+        if not isinstance(task_name, str):
+            raise TypeError(f"TaskParams.task_name must be a str, got {type(task_name).__name__}")
+        if callback is not None and not callable(callback):
+            raise TypeError("TaskParams.callback must be callable")
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            raise TypeError(f"TaskParams.timeout must be an int, got {type(timeout).__name__}")
+        # Whole seconds only, as before: int() would silently turn 0.5 into 0
+        if isinstance(timeout, float) and not timeout.is_integer():
+            raise TypeError(f"TaskParams.timeout must be a whole number of seconds, got {timeout}")
+
+    @staticmethod
+    def _check_args(args) -> List[Any]:
+        if args is None:
+            return []
+        if not isinstance(args, (list, tuple)):
+            raise TypeError(f"TaskParams.args must be a list, got {type(args).__name__}")
+        return list(args)
+
+    @staticmethod
+    def _check_kwargs(kwargs) -> Dict[str, Any]:
+        if kwargs is None:
+            return {}
+        if not isinstance(kwargs, dict):
+            raise TypeError(f"TaskParams.kwargs must be a dict, got {type(kwargs).__name__}")
+        return dict(kwargs)
+
+    @classmethod
+    def many(
+        cls,
+        friend: str,
+        task_name: str,
+        args_list: Optional[Iterable[Optional[List[Any]]]] = None,
+        kwargs_list: Optional[Iterable[Optional[Dict[str, Any]]]] = None,
+        callback: Optional[Callable] = None,
+        timeout: int = 30,
+    ) -> List["TaskParams"]:
+        """
+        Build one TaskParams per entry of `args_list` / `kwargs_list` (zipped when both
+        are given) for the same friend and task. Shared fields are checked once.
+        """
+        cls._check_shared(friend, task_name, callback, timeout)
+        timeout = int(timeout)
+
+        if args_list is not None and kwargs_list is not None:
+            pairs = zip(args_list, kwargs_list, strict=True)
+        elif args_list is not None:
+            pairs = ((args, None) for args in args_list)
+        elif kwargs_list is not None:
+            pairs = ((None, kwargs) for kwargs in kwargs_list)
+        else:
+            return []
+
+        check_args, check_kwargs, new = cls._check_args, cls._check_kwargs, object.__new__
+        params = []
+        for args, kwargs in pairs:
+            task = new(cls)
+            task.friend = friend
+            task.task_name = task_name
+            task.callback = callback
+            task.args = check_args(args)
+            task.kwargs = check_kwargs(kwargs)
+            task.timeout = timeout
+            params.append(task)
+        return params
+
+    def __repr__(self):
+        return f"TaskParams(friend={self.friend!r}, task_name={self.task_name!r}, args={self.args!r}, kwargs={self.kwargs!r})"
+
+
+# Sentinel for _await_params: use the TaskParams' own timeout
+_TASK_TIMEOUT = object()
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart, across all coroutines sharing it."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+
+    async def wait(self):
+        import asyncio
 
-        self.friend = validated.friend
-        self.task_name = validated.task_name
-        self.callback = validated.callback
-        self.args = validated.args or []
-        self.kwargs = validated.kwargs or {}
-        self.timeout = validated.timeout
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
 
 class TaskManager:
     _instance = None
+    # Default bound on concurrently running tasks in paraTasks/paraSyncTasks
+    MAX_IN_FLIGHT = int(os.getenv("TASK_MAX_IN_FLIGHT", 64))
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -75,9 +159,19 @@ class TaskManager:
                 broker_retry=True
             )
             self._friends = boot.celery_friends
+            self._backend_url = boot.celery_backend
+
+            # Per-friend tuning from friends.yaml: client-side app settings and per-message options
+            from kimera.process.CeleryProfile import CeleryProfile
+            self._celery_app.conf.update(CeleryProfile.client_conf(boot.celery_profiles.values()))
+            self._send_options = {name: profile.send_options() for name, profile in boot.celery_profiles.items()}
         else:
             self._celery_app = None
+            self._backend_url = None
+            self._send_options = {}
 
+        self._result_listeners = weakref.WeakKeyDictionary()
+        self._rate_limiters = {}
         self._initialized = True
 
     @property
@@ -88,7 +182,52 @@ class TaskManager:
     def friends(self):
         return self._friends
 
-    async def send_async(self, task_name, friend, args=None, kwargs=None, callback=None, func=None, poll_start=0.1, max_poll=1):
+    def _options(self, friend: str, priority: Optional[int] = None) -> Dict[str, Any]:
+        """Per-message send options for a friend (CeleryProfile), with an optional priority override."""
+        options = dict(self._send_options.get(friend, {}))
+        if priority is not None:
+            options["priority"] = priority
+        return options
+
+    def _result_listener(self):
+        """ResultListener for the running loop, or None when the result backend is not Redis."""
+        import asyncio
+        from kimera.process.ResultListener import ResultListener
+
+        if not ResultListener.supports(self._backend_url):
+            return None
+        loop = asyncio.get_running_loop()
+        listener = self._result_listeners.get(loop)
+        if listener is None:
+            listener = self._result_listeners[loop] = ResultListener(self.celery_app.backend, self._backend_url)
+        return listener
+
+    async def _wait_result(self, result, timeout=None, poll_start=0.1, max_poll=1):
+        """
+        Wait for an AsyncResult: pushed through the ResultListener on Redis backends,
+        polled with backoff otherwise. Raises the task's exception if it failed and
+        asyncio.TimeoutError after `timeout` seconds.
+        """
+        import asyncio
+
+        listener = self._result_listener()
+        if listener is not None:
+            return await listener.wait(result.id, timeout)
+
+        async def poll(start):
+            while not result.ready():
+                await asyncio.sleep(min(start, max_poll))
+                start *= 2
+            return result.get(propagate=True)
+
+        return await asyncio.wait_for(poll(poll_start), timeout)
+
+    async def send_async(self, task_name, friend, args=None, kwargs=None, callback=None, func=None, poll_start=0.1, max_poll=1, ignore_result=False, priority=None):
+        """
+        Dispatch a task and poll its result in a background asyncio task.
+        With ignore_result=True the task is sent fire-and-forget: the worker stores no
+        result, nothing is polled, and only the task id is returned.
+        """
         import asyncio
         import celery.result
         from kimera.helpers.Helpers import Helpers
@@ -97,165 +236,266 @@ class TaskManager:
             raise Exception("Microservice has no celery instance")
         if friend not in self.friends:
             raise Exception(f"{friend} is not registered as friend")
+        if ignore_result and (callback or func):
+            raise ValueError("callback/func need the task result, they cannot be used with ignore_result=True")
 
+        options = self._options(friend, priority)
         friend = self.friends[friend]
         result = self.celery_app.send_task(
             f"{friend['route']}.{task_name}",
             args=args,
             kwargs=kwargs,
             result_cls=celery.result.AsyncResult,
-            queue=friend['queue']
+            queue=friend['queue'],
+            ignore_result=ignore_result,
+            **options
         )
 
+        if ignore_result:
+            return result.id
+
         async def do_result(_result, start, limit):
-            Helpers.sysPrint(f"Polling {friend['route']}", f"{task_name}")
-            while not _result.successful():
-                await asyncio.sleep(min(start, limit))
-                start *= 2
+            Helpers.sysPrint(f"Awaiting {friend['route']}", f"{task_name}")
+            try:
+                value = await self._wait_result(_result, poll_start=start, max_poll=limit)
+            except Exception as e:
+                Helpers.errPrint(f"Task {task_name} ({_result.id}) failed: {e}", os.path.basename(__file__))
+                _result.forget()
+                return
 
             if callback:
-                await callback(_result.get())
+                await callback(value)
             if func:
-                func(_result.get())
+                func(value)
 
             _result.forget()
             _result.revoke(terminate=True, signal='SIGKILL')
 
         return asyncio.create_task(do_result(_result=result, start=poll_start, limit=max_poll))
 
-    async def paraSyncTasks(self, taskList: List[TaskParams]):
+    def _rate_limiter(self, friend: str, rate_limits: Optional[Dict[str, float]] = None):
+        """Process-wide limiter for a friend: `rate_limits[friend]`, else its `rate_limit` in friends.yaml (tasks/s)."""
+        rate = (rate_limits or {}).get(friend) or self.friends[friend].get('rate_limit')
+        if not rate:
+            return None
+        key = (friend, float(rate))
+        if key not in self._rate_limiters:
+            self._rate_limiters[key] = _RateLimiter(float(rate))
+        return self._rate_limiters[key]
+
+    async def _fan_out(self, taskList: List[TaskParams], run: Callable, max_in_flight: Optional[int] = None,
+                       rate_limits: Optional[Dict[str, float]] = None):
+        """
+        Run `run(task)` for every task with at most `max_in_flight` running, yielding
+        (index, result) as they complete. Failures (including unknown friends) are
+        yielded as the exception instead of being dropped.
+        """
+        import asyncio
+
         if self.celery_app is None:
             raise Exception("Microservice has no celery instance")
 
-        tasks = [
-            self.send_await(
-                friend=task.friend,
-                task_name=task.task_name,
-                args=task.args,
-                kwargs=task.kwargs,
-                timeout=task.timeout
-            )
-            for task in taskList if task.friend in self.friends
-        ]
+        tasks = list(taskList)
+        if not tasks:
+            return
+
+        done = asyncio.Queue()
+        indexes = iter(range(len(tasks)))
+
+        async def worker():
+            # Each worker pulls the next task as soon as its previous one finishes
+            for index in indexes:
+                task = tasks[index]
+                try:
+                    if task.friend not in self.friends:
+                        raise Exception(f"{task.friend} is not registered as friend")
+                    limiter = self._rate_limiter(task.friend, rate_limits)
+                    if limiter is not None:
+                        await limiter.wait()
+                    value = await run(task)
+                except Exception as e:
+                    value = e
+                done.put_nowait((index, value))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(max_in_flight or self.MAX_IN_FLIGHT, len(tasks)))]
+        try:
+            for _ in range(len(tasks)):
+                yield await done.get()
+        finally:
+            for w in workers:
+                w.cancel()
+
+    def _await_params(self, task: TaskParams, timeout=_TASK_TIMEOUT):
+        return self.send_await(
+            friend=task.friend,
+            task_name=task.task_name,
+            args=task.args,
+            kwargs=task.kwargs,
+            timeout=task.timeout if timeout is _TASK_TIMEOUT else timeout
+        )
 
+    async def paraSyncTasksIter(self, taskList: List[TaskParams], max_in_flight: Optional[int] = None,
+                                rate_limits: Optional[Dict[str, float]] = None):
+        """Async iterator of (index, result-or-exception) in completion order."""
+        async for item in self._fan_out(taskList, self._await_params, max_in_flight, rate_limits):
+            yield item
+
+    async def paraSyncTasks(self, taskList: List[TaskParams], max_in_flight: Optional[int] = None,
+                            rate_limits: Optional[Dict[str, float]] = None):
+        """
+        Await many tasks with bounded concurrency. Returns one entry per task in input
+        order: its result, or the exception if it failed, timed out or its friend is unknown.
+        """
+        taskList = list(taskList)
+        results = [None] * len(taskList)
+        async for index, value in self._fan_out(taskList, self._await_params, max_in_flight, rate_limits):
+            results[index] = value
+        return results
+
+    async def paraTasks(self, taskList: List[TaskParams], gather_callback: Optional[Callable] = None,
+                        max_in_flight: Optional[int] = None, rate_limits: Optional[Dict[str, float]] = None,
+                        timeout: Optional[float] = None):
+        """
+        Background version of paraSyncTasks: each task's `callback` is awaited with its
+        result as it completes, and `gather_callback` (if a coroutine function) with the
+        input-ordered results at the end. Returns the asyncio Task running the fan-out.
+        Like the original fire-and-forget paraTasks, results are waited for without a
+        deadline (TaskParams.timeout is ignored) unless `timeout` seconds is given.
+        """
         import asyncio
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        from kimera.helpers.Helpers import Helpers
 
-    async def paraTasks(self, taskList: List[TaskParams], gather_callback: Optional[Callable] = None):
         if self.celery_app is None:
             raise Exception("Microservice has no celery instance")
 
-        import asyncio
-
-        to_send = [
-            asyncio.create_task(
-                self.send_async(
-                    friend=task.friend,
-                    task_name=task.task_name,
-                    args=task.args,
-                    kwargs=task.kwargs,
-                    callback=task.callback
-                )
+        taskList = list(taskList)
+
+        async def run(task):
+            value = await self._await_params(task, timeout)
+            if task.callback:
+                await task.callback(value)
+            return value
+
+        async def fan_out():
+            results = [None] * len(taskList)
+            async for index, value in self._fan_out(taskList, run, max_in_flight, rate_limits):
+                results[index] = value
+                if isinstance(value, Exception):
+                    Helpers.errPrint(f"Task {taskList[index].task_name} failed: {value}", os.path.basename(__file__))
+            if gather_callback and asyncio.iscoroutinefunction(gather_callback):
+                await gather_callback(results)
+            return results
+
+        return asyncio.create_task(fan_out())
+
+    def _signature(self, task: TaskParams, link: bool = False):
+        """
+        Celery signature for a TaskParams on its friend's queue. With link=True it is
+        wrapped in the Canvas merge task, which folds the previous result into its
+        args/kwargs on the worker (dict -> kwargs, list -> args, scalar -> payload).
+        """
+        from kimera.process.Canvas import MERGE_TASK
+
+        if task.friend not in self.friends:
+            raise Exception(f"{task.friend} is not registered as a friend")
+
+        options = self._options(task.friend)
+        friend = self.friends[task.friend]
+        name = f"{friend['route']}.{task.task_name}"
+        if link:
+            return self.celery_app.signature(
+                MERGE_TASK,
+                kwargs={"task": name, "args": list(task.args), "kwargs": dict(task.kwargs), "queue": friend['queue'],
+                        "options": options},
+                queue=friend['queue'],
+                **options
             )
-            for task in taskList if task.friend in self.friends
-        ]
+        return self.celery_app.signature(name, args=list(task.args), kwargs=dict(task.kwargs), queue=friend['queue'],
+                                         **options)
 
-        if gather_callback and asyncio.iscoroutinefunction(gather_callback):
-            gather = asyncio.create_task(asyncio.gather(*to_send))
-            gather.add_done_callback(lambda res: asyncio.create_task(gather_callback(res.result())))
-        else:
-            return await asyncio.gather(*to_send)
+    def _chain(self, taskList: List[TaskParams]):
+        from celery import chain
 
-    def _get_callback_wrapper(self):
-        from functools import partial
+        if self.celery_app is None:
+            raise Exception("Microservice has no celery instance")
+        if len(taskList) < 2:
+            raise Exception("Chain must have at least two tasks")
 
-        async def callback_wrapper(result, index, taskList):
-            task = taskList[index]
+        return chain(self._signature(taskList[0]), *(self._signature(task, link=True) for task in taskList[1:]))
 
-            if task.kwargs is None:
-                task.kwargs = {}
+    async def chainSyncTasks(self, taskList: List[TaskParams]):
+        import asyncio
+        from kimera.helpers.Helpers import Helpers
 
-            bound_callback = partial(callback_wrapper, index=index + 1, taskList=taskList)
+        result = self._chain(taskList).apply_async()
+        timeout = sum(task.timeout for task in taskList)
 
-            if index + 1 == len(taskList):
-                bound_callback = task.callback if task.callback else lambda result: True if result else False
+        try:
+            value = await self._wait_result(result, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"Chain {result.id} timed out after {timeout} seconds.")
 
-            if task.friend in self.friends:
-                if isinstance(result, dict):
-                    task.kwargs.update(result)
-                elif isinstance(result, list):
-                    task.args.extend(result)
-                else:
-                    task.kwargs["payload"] = result
+        Helpers.sysPrint(f"Chain {' -> '.join(task.task_name for task in taskList)} result:", value)
+        return value
 
-                await self.send_async(
-                    friend=task.friend,
-                    task_name=task.task_name,
-                    args=task.args,
-                    kwargs=task.kwargs,
-                    callback=bound_callback
-                )
+    async def chainTasks(self, taskList: List[TaskParams]):
+        import asyncio
+        from kimera.helpers.Helpers import Helpers
 
-        return callback_wrapper
+        result = self._chain(taskList).apply_async()
+        callback = taskList[-1].callback
 
-    async def chainSyncTasks(self, taskList: List[TaskParams]):
-        from kimera.helpers.Helpers import Helpers
+        async def do_result():
+            try:
+                value = await self._wait_result(result)
+            except Exception as e:
+                Helpers.errPrint(f"Chain {result.id} failed: {e}", os.path.basename(__file__))
+                return None
+            if callback:
+                await callback(value)
+            return value
 
-        if self.celery_app is None:
-            raise Exception("Microservice has no celery instance")
-        if len(taskList) < 2:
-            raise Exception("Chain must have at least two tasks")
+        return asyncio.create_task(do_result())
 
-        result = None
-        for task in taskList:
-            if task.friend not in self.friends:
-                raise Exception(f"{task.friend} is not registered as a friend")
-
-            args = task.args
-            kwargs = task.kwargs
-
-            if result is not None:
-                if isinstance(result, dict):
-                    task.kwargs.update(result)
-                elif isinstance(result, list):
-                    task.args.extend(result)
-                else:
-                    task.kwargs["payload"] = result
-
-            result = await self.send_await(
-                task_name=task.task_name,
-                friend=task.friend,
-                args=args,
-                kwargs=kwargs,
-                timeout=task.timeout
-            )
+    async def groupTasks(self, taskList: List[TaskParams], timeout: Optional[float] = None) -> List[Any]:
+        """
+        Run tasks in parallel as one Celery group (a single dispatch). Returns results in
+        input order, with the exception in place of any task that failed or timed out.
+        """
+        import asyncio
+        from celery import group
 
-            Helpers.sysPrint(f"Task {task.task_name} result:", result)
+        if self.celery_app is None:
+            raise Exception("Microservice has no celery instance")
 
-        return result
+        result = group(self._signature(task) for task in taskList).apply_async()
+        timeout = timeout if timeout is not None else max((task.timeout for task in taskList), default=30)
+        return await asyncio.gather(
+            *(self._wait_result(child, timeout=timeout) for child in result.results),
+            return_exceptions=True
+        )
 
-    async def chainTasks(self, taskList: List[TaskParams]):
+    async def chordTasks(self, header: List[TaskParams], body: TaskParams, timeout: Optional[float] = None) -> Any:
+        """
+        Run `header` in parallel, then `body` on a worker with the list of header results
+        merged into its args. Returns the body's result.
+        """
         import asyncio
+        from celery import chord, group
 
         if self.celery_app is None:
             raise Exception("Microservice has no celery instance")
-        if len(taskList) < 2:
-            raise Exception("Chain must have at least two tasks")
 
-        task = taskList[0]
+        result = chord(group(self._signature(task) for task in header), self._signature(body, link=True)).apply_async()
+        if timeout is None:
+            timeout = max((task.timeout for task in header), default=0) + body.timeout
 
-        if task.friend in self.friends:
-            bound_callback = partial(self._get_callback_wrapper(), index=1, taskList=taskList)
-
-            return asyncio.create_task(self.send_async(
-                friend=task.friend,
-                task_name=task.task_name,
-                args=task.args,
-                kwargs=task.kwargs,
-                callback=bound_callback
-            ))
+        try:
+            return await self._wait_result(result, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"Chord {result.id} timed out after {timeout} seconds.")
 
-    async def send_await(self, task_name, friend, args=None, kwargs=None, timeout=30, poll_start=0.1, max_poll=1):
+    async def send_await(self, task_name, friend, args=None, kwargs=None, timeout=30, poll_start=0.1, max_poll=1, priority=None):
         import asyncio
         import celery.result
         from kimera.helpers.Helpers import Helpers
@@ -265,30 +505,26 @@ class TaskManager:
         if friend not in self.friends:
             raise Exception(f"{friend} is not registered as friend")
 
+        options = self._options(friend, priority)
         friend = self.friends[friend]
         result = self.celery_app.send_task(
             f"{friend['route']}.{task_name}",
             args=args,
             kwargs=kwargs,
             result_cls=celery.result.AsyncResult,
-            queue=friend['queue']
+            queue=friend['queue'],
+            **options
         )
 
-        Helpers.sysPrint(f"Polling {friend['route']}", f"{task_name}")
-
-        async def poll_result(_result, start=0.1, limit=1):
-            while not _result.successful():
-                await asyncio.sleep(min(start, limit))
-                start *= 2
-            return _result.get()
+        Helpers.sysPrint(f"Awaiting {friend['route']}", f"{task_name}")
 
         try:
-            result_data = await asyncio.wait_for(
-                poll_result(_result=result, start=poll_start, limit=max_poll),
-                timeout=timeout
-            )
+            result_data = await self._wait_result(result, timeout=timeout, poll_start=poll_start, max_poll=max_poll)
         except asyncio.TimeoutError:
             raise TimeoutException(f"Task {task_name} timed out after {timeout} seconds.")
+        except Exception:
+            result.forget()
+            raise
 
         result.forget()
         result.revoke(terminate=True, signal='SIGKILL')
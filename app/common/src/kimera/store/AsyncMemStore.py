@@ -0,0 +1,279 @@
+import asyncio
+import os
+import pickle
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Iterable, AsyncIterator, Optional, Union
+from datetime import timedelta
+
+import redis.asyncio as aioredis
+from kimera.helpers.Helpers import Helpers
+from kimera.store.MemCodec import MemCodec
+from kimera.store.MemStore import MemPipeline, Ttl, _ttl_kwargs
+import binascii
+
+debug = os.getenv("DEBUG_STORES",False)
+
+
+class AsyncMemPipeline(MemPipeline):
+    """MemPipeline over a redis.asyncio pipeline: commands queue synchronously, `execute()` is awaited."""
+
+    async def execute(self) -> List[Any]:
+        raw = await self._pipe.execute()
+        self.results = [d(r) if d is not None else r for d, r in zip(self._decoders, raw)]
+        self._decoders = []
+        return self.results
+
+    async def reset(self):
+        await self._pipe.reset()
+        self._decoders = []
+
+
+class AsyncMemStore:
+    """
+    Non-blocking twin of MemStore on redis.asyncio, for FastAPI handlers and asyncio workers.
+    Same key layout and codecs as MemStore, so both flavours can share a namespace.
+    asyncio connections belong to the loop that opened them, so pools are per event loop:
+    all AsyncMemStores on the same URI (and max_connections) share one pool per loop.
+    """
+
+    # loop -> {(uri, max_connections): pool}
+    _pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, aioredis.ConnectionPool]]" = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, uri=None, connection_name='default', namespace='_root', codec='pickle', compression=None,
+                 compress_min=1024, compress_level=None, max_connections=None, **kwargs):
+        self.uri = uri
+        self.connection_name = connection_name
+        self.namespace = namespace
+        self.max_connections = max_connections
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = \
+            weakref.WeakKeyDictionary()
+        self.codec = MemCodec(codec=codec, compression=compression, compress_min=compress_min,
+                              compress_level=compress_level)
+
+    @property
+    def client(self) -> Optional[aioredis.Redis]:
+        """Client for the running event loop, on that loop's shared pool."""
+        if not self.uri:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = aioredis.Redis(
+                connection_pool=self._pool(loop, self.uri, self.max_connections))
+        return client
+
+    @classmethod
+    def _pool(cls, loop: asyncio.AbstractEventLoop, uri: str,
+              max_connections: Optional[int] = None) -> aioredis.ConnectionPool:
+        pools = cls._pools.setdefault(loop, {})
+        key = (uri, max_connections)
+        if key not in pools:
+            pools[key] = aioredis.ConnectionPool.from_url(uri, max_connections=max_connections)
+        return pools[key]
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _encode(self, value: Any) -> bytes:
+        return self.codec.encode(value)
+
+    def _decode(self, raw: Optional[bytes], default: Any = None, key: str = None) -> Any:
+        if raw is None:
+            return default
+        try:
+            return self.codec.decode(raw)
+        except (binascii.Error, pickle.UnpicklingError, Exception) as e:
+            Helpers.errPrint(f"Failed to decode key {key}: {e}", os.path.basename(__file__))
+            return default
+
+    async def set(self, key: str, value: Any, ttl: Ttl = None):
+        """Encode any value with the namespace codec and store in Redis, optionally expiring after `ttl` seconds."""
+        namespaced_key = self._full_key(key)
+        try:
+            await self.client.set(namespaced_key, self._encode(value), **_ttl_kwargs(ttl))
+            if debug:
+                Helpers.sysPrint(f"Set key:", namespaced_key)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to set key {namespaced_key}: {e}", os.path.basename(__file__))
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve and decode a value from Redis with a single GET."""
+        namespaced_key = self._full_key(key)
+        try:
+            raw = await self.client.get(namespaced_key)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to get key {namespaced_key}: {e}", os.path.basename(__file__))
+            return default
+        return self._decode(raw, default, namespaced_key)
+
+    async def delete(self, key: str):
+        """Delete a key from Redis."""
+        namespaced_key = self._full_key(key)
+        try:
+            await self.client.delete(namespaced_key)
+            if debug:
+                Helpers.print(f"Deleted key {namespaced_key} from Redis.")
+        except Exception as e:
+            Helpers.errPrint(f"Failed to delete key {namespaced_key}: {e}", os.path.basename(__file__))
+
+    # === BATCH METHODS (one round-trip per call) ===
+
+    async def mget(self, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """Retrieve many values with one MGET. Missing keys map to `default`."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = await self.client.mget([self._full_key(k) for k in keys])
+        except Exception as e:
+            Helpers.errPrint(f"Failed to MGET {len(keys)} keys: {e}", os.path.basename(__file__))
+            return {k: default for k in keys}
+        return {k: self._decode(raw, default, k) for k, raw in zip(keys, raws)}
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Ttl = None):
+        """Store many values in one round-trip (MSET, or a pipeline of SETs when `ttl` is given)."""
+        if not mapping:
+            return
+        try:
+            if ttl is None:
+                await self.client.mset({self._full_key(k): self._encode(v) for k, v in mapping.items()})
+            else:
+                async with self.pipeline() as pipe:
+                    for k, v in mapping.items():
+                        pipe.set(k, v, ttl=ttl)
+            if debug:
+                Helpers.sysPrint(f"MSET keys:", len(mapping))
+        except Exception as e:
+            Helpers.errPrint(f"Failed to MSET {len(mapping)} keys: {e}", os.path.basename(__file__))
+
+    async def mdelete(self, keys: Iterable[str]) -> int:
+        """Delete many keys with one DEL and return how many existed."""
+        keys = [self._full_key(k) for k in keys]
+        if not keys:
+            return 0
+        try:
+            return await self.client.delete(*keys)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to delete {len(keys)} keys: {e}", os.path.basename(__file__))
+            return 0
+
+    async def expire(self, key: str, ttl: Union[int, timedelta]) -> bool:
+        """Set a TTL on an existing key."""
+        try:
+            return bool(await self.client.expire(self._full_key(key), ttl))
+        except Exception as e:
+            Helpers.errPrint(f"Failed to EXPIRE {key}: {e}", os.path.basename(__file__))
+            return False
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator[AsyncMemPipeline]:
+        """
+        Queue commands and send them in one round-trip when the block exits.
+
+            async with store.pipeline() as pipe:
+                pipe.set("a", 1, ttl=60).get("b")
+            a_ok, b = pipe.results
+        """
+        pipe = AsyncMemPipeline(self, transaction=transaction)
+        try:
+            yield pipe
+            if len(pipe):
+                await pipe.execute()
+        finally:
+            await pipe.reset()
+
+    # === SCANNING ===
+
+    async def iter_keys(self, pattern='*', count: int = 1000) -> AsyncIterator[str]:
+        """Lazily iterate keys matching the pattern within the namespace using SCAN."""
+        full_pattern = f"{self.namespace}:{pattern}"
+        async for key in self.client.scan_iter(match=full_pattern, count=count):
+            yield key.decode('utf-8')
+
+    async def iter_batches(self, pattern='*', count: int = 1000) -> AsyncIterator[List[str]]:
+        """Iterate matching keys in lists of up to `count` keys."""
+        batch = []
+        async for key in self.iter_keys(pattern, count=count):
+            batch.append(key)
+            if len(batch) >= count:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def iter_items(self, pattern='*', count: int = 1000) -> AsyncIterator[tuple]:
+        """Iterate (key, value) pairs matching the pattern, decoding values fetched with one MGET per batch."""
+        async for batch in self.iter_batches(pattern, count=count):
+            for key, raw in zip(batch, await self.client.mget(batch)):
+                if raw is not None:
+                    yield key, self._decode(raw, None, key)
+
+    async def keys(self, pattern='*', count: int = 1000) -> List[str]:
+        """List all keys matching the pattern within the namespace (SCAN-based)."""
+        try:
+            return [key async for key in self.iter_keys(pattern, count=count)]
+        except Exception as e:
+            Helpers.errPrint(f"Failed to retrieve keys: {e}", os.path.basename(__file__))
+            return []
+
+    async def flush(self, pattern='*', batch_size: int = 1000) -> int:
+        """Delete all keys within the namespace with chunked UNLINK. Returns the number deleted."""
+        deleted = 0
+        try:
+            async for batch in self.iter_batches(pattern, count=batch_size):
+                deleted += await self.client.unlink(*batch)
+            if debug:
+                Helpers.print(f"Flushed {deleted} keys from namespace {self.namespace}.")
+        except Exception as e:
+            Helpers.errPrint(f"Failed to flush namespace {self.namespace}: {e}", os.path.basename(__file__))
+        return deleted
+
+    async def close(self):
+        """Release this store's client on the running loop; the shared pool stays open for other namespaces."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    # === HASH METHODS for HIGH-FREQUENCY ACCESS ===
+
+    async def hset(self, key: str, field: str = None, value: Any = None, mapping: Dict[str, Any] = None):
+        """Set one or many fields in a Redis hash."""
+        try:
+            redis_key = self._full_key(key)
+            if mapping:
+                await self.client.hset(redis_key, mapping=mapping)
+            elif field is not None:
+                await self.client.hset(redis_key, field, value)
+            if debug:
+                Helpers.sysPrint(f"HSET key: {redis_key}")
+        except Exception as e:
+            Helpers.errPrint(f"Failed to HSET {key}: {e}", os.path.basename(__file__))
+
+    async def hget(self, key: str, field: str) -> Any:
+        """Get a single field from a Redis hash. Returns string or None."""
+        try:
+            result = await self.client.hget(self._full_key(key), field)
+            return result.decode("utf-8") if result is not None else None
+        except Exception as e:
+            Helpers.errPrint(f"Failed to HGET {key}:{field}: {e}", os.path.basename(__file__))
+            return None
+
+    async def hgetall(self, key: str) -> Dict[str, Any]:
+        """Get all fields and values from a Redis hash. Returns a dict of strings."""
+        try:
+            raw = await self.client.hgetall(self._full_key(key))
+            return {k.decode("utf-8"): v.decode("utf-8") for k, v in raw.items()}
+        except Exception as e:
+            Helpers.errPrint(f"Failed to HGETALL {key}: {e}", os.path.basename(__file__))
+            return {}
+
+    async def hdel(self, key: str, field: str):
+        """Delete a field from a Redis hash."""
+        try:
+            await self.client.hdel(self._full_key(key), field)
+            if debug:
+                Helpers.print(f"HDEL field '{field}' from {self._full_key(key)}")
+        except Exception as e:
+            Helpers.errPrint(f"Failed to HDEL {key}:{field}: {e}", os.path.basename(__file__))
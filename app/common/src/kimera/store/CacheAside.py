@@ -0,0 +1,273 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import math
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional, Union
+
+# Deletes the lock only if we still own it
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _Flight:
+    """In-process single-flight slot shared by threads waiting on the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class CacheAside:
+    """
+    Cache-aside wrapper around one function, backed by a StoreFactory mem store namespace.
+
+    - Single-flight: concurrent misses for the same key in one process share one call.
+    - Cross-process: a short Redis lock (SET NX PX) lets one process recompute while
+      the others wait for its value (cold key) or keep serving the current one.
+    - Probabilistic early refresh (XFetch): entries are recomputed slightly before they
+      expire, with a probability weighted by how long the last computation took.
+    - Negative caching: `None` results are cached for `negative_ttl` seconds.
+
+    Entries are stored as [value, compute_seconds, expires_at].
+    Async functions use the AsyncMemStore flavour so the event loop never blocks.
+    """
+
+    def __init__(self, func: Callable, namespace: str = "_cache", ttl: float = 60,
+                 key: Optional[Union[str, Callable[..., str]]] = None, connection_name: str = "default",
+                 negative_ttl: Optional[float] = None, beta: float = 1.0, lock_timeout: float = 10.0):
+        self.func = func
+        self.namespace = namespace
+        self.ttl = ttl
+        self.key = key
+        self.connection_name = connection_name
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.beta = beta
+        self.lock_timeout = lock_timeout
+
+        self.is_async = inspect.iscoroutinefunction(func)
+        self._signature = inspect.signature(func)
+        params = list(self._signature.parameters)
+        # Methods: the bound self/cls never goes into the default key
+        self._skip_first = bool(params) and params[0] in ("self", "cls")
+        self._prefix = f"{func.__module__}.{func.__qualname__}"
+        self._store = None
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    @property
+    def store(self):
+        # Resolved on first use: stores are only registered once Bootstrap has run
+        if self._store is None:
+            from kimera.store.StoreFactory import StoreFactory
+            self._store = StoreFactory.get_mem_store(
+                namespace=self.namespace,
+                connection_name=self.connection_name,
+                asynchronous=self.is_async
+            )
+        return self._store
+
+    def cache_key(self, *args, **kwargs) -> str:
+        """
+        Key for a call: `key(*args, **kwargs)`, `key.format(**arguments)` or a hash of the
+        arguments (without a leading self/cls).
+        """
+        if callable(self.key):
+            return str(self.key(*args, **kwargs))
+        if isinstance(self.key, str):
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return self.key.format(**bound.arguments)
+        return f"{self._prefix}:{self._digest(args, kwargs)}"
+
+    def _digest(self, args, kwargs) -> str:
+        bound = self._signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())
+        if self._skip_first:
+            arguments = arguments[1:]
+        text = repr(arguments)
+        # Default object reprs differ per instance and per process, so they would never hit
+        if " object at 0x" in text:
+            raise TypeError(f"{self._prefix}: arguments have no stable repr, pass key= to cached()")
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    # --- entry helpers ---
+
+    def _fresh(self, entry) -> bool:
+        _, delta, expires_at = entry
+        # XFetch: -log(U) is >= 0, so the effective "now" drifts ahead by a random multiple of delta
+        return time.time() - delta * self.beta * math.log(random.random() or 1e-12) < expires_at
+
+    def _entry(self, value: Any, delta: float):
+        ttl = self.negative_ttl if value is None else self.ttl
+        return [value, delta, time.time() + ttl], ttl
+
+    def _lock_key(self, key: str) -> str:
+        return self.store._full_key(f"lock:{key}")
+
+    # --- sync path ---
+
+    def call(self, *args, **kwargs):
+        key = self.cache_key(*args, **kwargs)
+        entry = self.store.get(key)
+        if entry is not None and self._fresh(entry):
+            return entry[0]
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if entry is not None:
+                return entry[0]
+            if flight.done.wait(self.lock_timeout):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            return self.func(*args, **kwargs)
+
+        try:
+            flight.value = self._load(key, entry, args, kwargs)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.done.set()
+            with self._flights_lock:
+                self._flights.pop(key, None)
+
+    def _load(self, key, entry, args, kwargs):
+        store = self.store
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        locked = store.client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000))
+
+        if not locked:
+            if entry is not None:
+                # Another process is refreshing, keep serving the current value
+                return entry[0]
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = store.get(key)
+                if entry is not None:
+                    return entry[0]
+            # Lock holder is slow or gone, compute without it
+
+        try:
+            start = time.perf_counter()
+            value = self.func(*args, **kwargs)
+            new_entry, ttl = self._entry(value, time.perf_counter() - start)
+            if ttl > 0:
+                store.set(key, new_entry, ttl=ttl)
+            return value
+        finally:
+            if locked:
+                store.client.eval(_RELEASE_LOCK, 1, lock_key, token)
+
+    def invalidate(self, *args, **kwargs):
+        self.store.delete(self.cache_key(*args, **kwargs))
+
+    # --- async path ---
+
+    async def acall(self, *args, **kwargs):
+        key = self.cache_key(*args, **kwargs)
+        entry = await self.store.get(key)
+        if entry is not None and self._fresh(entry):
+            return entry[0]
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            if entry is not None:
+                return entry[0]
+            return await asyncio.shield(flight)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            value = await self._aload(key, entry, args, kwargs)
+            flight.set_result(value)
+            return value
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark retrieved so an unawaited flight does not log "exception never retrieved"
+            flight.exception()
+            raise
+        finally:
+            self._flights.pop(key, None)
+
+    async def _aload(self, key, entry, args, kwargs):
+        store = self.store
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        locked = await store.client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000))
+
+        if not locked:
+            if entry is not None:
+                return entry[0]
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                entry = await store.get(key)
+                if entry is not None:
+                    return entry[0]
+
+        try:
+            start = time.perf_counter()
+            value = await self.func(*args, **kwargs)
+            new_entry, ttl = self._entry(value, time.perf_counter() - start)
+            if ttl > 0:
+                await store.set(key, new_entry, ttl=ttl)
+            return value
+        finally:
+            if locked:
+                await store.client.eval(_RELEASE_LOCK, 1, lock_key, token)
+
+    async def ainvalidate(self, *args, **kwargs):
+        await self.store.delete(self.cache_key(*args, **kwargs))
+
+
+def cached(namespace: str = "_cache", ttl: float = 60, key: Optional[Union[str, Callable[..., str]]] = None,
+           connection_name: str = "default", negative_ttl: Optional[float] = None, beta: float = 1.0,
+           lock_timeout: float = 10.0):
+    """
+    Cache-aside decorator for sync and async functions (see CacheAside).
+
+        @cached(namespace="users", ttl=300, key="user:{user_id}")
+        async def load_user(user_id): ...
+
+        await load_user.invalidate(42)   # sync functions: load_user.invalidate(42)
+    """
+    def decorator(func):
+        cache = CacheAside(func, namespace=namespace, ttl=ttl, key=key, connection_name=connection_name,
+                           negative_ttl=negative_ttl, beta=beta, lock_timeout=lock_timeout)
+
+        if cache.is_async:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await cache.acall(*args, **kwargs)
+            wrapper.invalidate = cache.ainvalidate
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return cache.call(*args, **kwargs)
+            wrapper.invalidate = cache.invalidate
+
+        wrapper.cache = cache
+        wrapper.cache_key = cache.cache_key
+        return wrapper
+
+    return decorator
@@ -0,0 +1,117 @@
+import base64
+import pickle
+from typing import Any, Optional
+
+
+class MemCodecError(Exception):
+    """Raised for unknown codecs or when a codec's optional dependency is missing."""
+
+
+class MemCodec:
+    """
+    Value codec for MemStore.
+
+    Encoded values start with one header byte: bits 0-2 hold the serializer,
+    bits 3-4 the compression. Header bytes stay below 0x20, so they never clash
+    with the legacy base64 text format (pickle + base64, no header), which is
+    still decoded transparently.
+
+    Serializers: pickle (raw bytes), msgpack, orjson, base64 (legacy writer).
+    Compression: zstd or lz4, applied only to payloads of at least `compress_min` bytes.
+    msgpack, orjson, zstandard and lz4 are optional and imported on first use.
+    """
+
+    SERIALIZERS = {"pickle": 1, "msgpack": 2, "orjson": 3}
+    COMPRESSIONS = {None: 0, "zstd": 1, "lz4": 2}
+    _HEADER_LIMIT = 0x20
+
+    def __init__(self, codec: str = "pickle", compression: Optional[str] = None, compress_min: int = 1024,
+                 compress_level: Optional[int] = None, **kwargs):
+        if codec != "base64" and codec not in self.SERIALIZERS:
+            raise MemCodecError(f"Unknown MemStore codec '{codec}'")
+        if compression not in self.COMPRESSIONS:
+            raise MemCodecError(f"Unknown MemStore compression '{compression}'")
+
+        self.codec = codec
+        self.compression = compression
+        self.compress_min = compress_min
+        self.compress_level = compress_level
+
+        # Resolve optional modules up front so misconfiguration fails at startup
+        self._dumps, self._loads = self._serializer(codec) if codec != "base64" else (None, None)
+        self._compress, self._decompress = self._compressor(compression) if compression else (None, None)
+
+    # --- serializers / compressors ---
+
+    @staticmethod
+    def _serializer(name: str):
+        if name == "pickle":
+            return (lambda v: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)), pickle.loads
+        try:
+            if name == "msgpack":
+                import msgpack
+                return (lambda v: msgpack.packb(v, use_bin_type=True)), \
+                    (lambda b: msgpack.unpackb(b, raw=False, strict_map_key=False))
+            if name == "orjson":
+                import orjson
+                return orjson.dumps, orjson.loads
+        except ImportError as e:
+            raise MemCodecError(f"MemStore codec '{name}' requires the '{e.name}' package") from e
+        raise MemCodecError(f"Unknown MemStore codec '{name}'")
+
+    def _compressor(self, name: str):
+        try:
+            if name == "zstd":
+                import zstandard
+                level = self.compress_level if self.compress_level is not None else 3
+                return (lambda b: zstandard.ZstdCompressor(level=level).compress(b)), \
+                    (lambda b: zstandard.ZstdDecompressor().decompress(b))
+            if name == "lz4":
+                import lz4.frame
+                level = self.compress_level if self.compress_level is not None else 0
+                return (lambda b: lz4.frame.compress(b, compression_level=level)), lz4.frame.decompress
+        except ImportError as e:
+            raise MemCodecError(f"MemStore compression '{name}' requires the '{e.name}' package") from e
+        raise MemCodecError(f"Unknown MemStore compression '{name}'")
+
+    # --- public API ---
+
+    def encode(self, value: Any) -> bytes:
+        if self.codec == "base64":
+            return base64.b64encode(pickle.dumps(value))
+
+        payload = self._dumps(value)
+        compression = None
+        if self._compress is not None and len(payload) >= self.compress_min:
+            payload = self._compress(payload)
+            compression = self.compression
+
+        header = self.SERIALIZERS[self.codec] | (self.COMPRESSIONS[compression] << 3)
+        return bytes((header,)) + payload
+
+    def decode(self, raw: bytes) -> Any:
+        if not raw or raw[0] >= self._HEADER_LIMIT:
+            # Legacy pickle + base64 value written before codecs existed
+            return pickle.loads(base64.b64decode(raw, validate=True))
+
+        header = raw[0]
+        serializer = self._name(self.SERIALIZERS, header & 0x07)
+        compression = self._name(self.COMPRESSIONS, (header >> 3) & 0x03)
+
+        payload = raw[1:]
+        if compression:
+            decompress = self._decompress if compression == self.compression else self._compressor(compression)[1]
+            payload = decompress(payload)
+
+        # Values may have been written with another namespace's codec, decode by header
+        if serializer == self.codec:
+            return self._loads(payload)
+        _, loads = self._serializer(serializer)
+        return loads(payload)
+
+    @staticmethod
+    def _name(table: dict, code: int):
+        for name, value in table.items():
+            if value == code:
+                return name
+        raise MemCodecError(f"Unknown MemStore header code {code}")
@@ -1,53 +1,141 @@
 import os
-import base64
 import pickle
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
+from datetime import timedelta
 
 import redis
 from kimera.helpers.Helpers import Helpers
+from kimera.store.MemCodec import MemCodec
 import binascii
 
 debug = os.getenv("DEBUG_STORES",False)
 
+Ttl = Optional[Union[int, float, timedelta]]
+
+
+def _ttl_kwargs(ttl: Ttl) -> dict:
+    """Translate a TTL (seconds or timedelta) into redis SET expiry kwargs."""
+    if ttl is None:
+        return {}
+    if isinstance(ttl, timedelta):
+        ttl = ttl.total_seconds()
+    if float(ttl).is_integer():
+        return {"ex": int(ttl)}
+    return {"px": int(ttl * 1000)}
+
+
+class MemPipeline:
+    """
+    Namespaced, encoding-aware wrapper over a redis pipeline.
+    Commands are queued and sent in one round-trip by `execute()`;
+    results are decoded the same way as the matching MemStore methods.
+    """
+
+    def __init__(self, store: 'MemStore', transaction: bool = False):
+        self._store = store
+        self._pipe = store.client.pipeline(transaction=transaction)
+        self._decoders = []
+        self.results = None
+
+    def _queue(self, decoder=None):
+        self._decoders.append(decoder)
+        return self
+
+    def set(self, key: str, value: Any, ttl: Ttl = None):
+        self._pipe.set(self._store._full_key(key), self._store._encode(value), **_ttl_kwargs(ttl))
+        return self._queue()
+
+    def get(self, key: str, default: Any = None):
+        self._pipe.get(self._store._full_key(key))
+        return self._queue(lambda raw: self._store._decode(raw, default, key))
+
+    def delete(self, key: str):
+        self._pipe.delete(self._store._full_key(key))
+        return self._queue()
+
+    def expire(self, key: str, ttl: Union[int, timedelta]):
+        self._pipe.expire(self._store._full_key(key), ttl)
+        return self._queue()
+
+    def hset(self, key: str, field: str = None, value: Any = None, mapping: Dict[str, Any] = None):
+        if mapping:
+            self._pipe.hset(self._store._full_key(key), mapping=mapping)
+        else:
+            self._pipe.hset(self._store._full_key(key), field, value)
+        return self._queue()
+
+    def hget(self, key: str, field: str):
+        self._pipe.hget(self._store._full_key(key), field)
+        return self._queue(lambda raw: raw.decode("utf-8") if raw is not None else None)
+
+    def hgetall(self, key: str):
+        self._pipe.hgetall(self._store._full_key(key))
+        return self._queue(lambda raw: {k.decode("utf-8"): v.decode("utf-8") for k, v in raw.items()})
+
+    def hdel(self, key: str, field: str):
+        self._pipe.hdel(self._store._full_key(key), field)
+        return self._queue()
+
+    def __len__(self):
+        return len(self._decoders)
+
+    def execute(self) -> List[Any]:
+        """Send every queued command and return their decoded results in order."""
+        raw = self._pipe.execute()
+        self.results = [d(r) if d is not None else r for d, r in zip(self._decoders, raw)]
+        self._decoders = []
+        return self.results
+
+    def reset(self):
+        self._pipe.reset()
+        self._decoders = []
+
+
 class MemStore:
-    def __init__(self, uri=None, connection_name='default', namespace='_root', **kwargs):
+    def __init__(self, uri=None, connection_name='default', namespace='_root', codec='pickle', compression=None,
+                 compress_min=1024, compress_level=None, **kwargs):
         self.uri = uri
         self.connection_name = connection_name
         self.namespace = namespace
         self.client = redis.Redis.from_url(self.uri) if self.uri else None
+        self.codec = MemCodec(codec=codec, compression=compression, compress_min=compress_min,
+                              compress_level=compress_level)
 
     def _full_key(self, key: str) -> str:
         return f"{self.namespace}:{key}"
 
-    def set(self, key: str, value: Any):
-        """Pickle and base64-encode any value and store in Redis."""
+    def _encode(self, value: Any) -> bytes:
+        return self.codec.encode(value)
+
+    def _decode(self, raw: Optional[bytes], default: Any = None, key: str = None) -> Any:
+        if raw is None:
+            return default
+        try:
+            return self.codec.decode(raw)
+        except (binascii.Error, pickle.UnpicklingError, Exception) as e:
+            Helpers.errPrint(f"Failed to decode key {key}: {e}", os.path.basename(__file__))
+            return default
+
+    def set(self, key: str, value: Any, ttl: Ttl = None):
+        """Encode any value with the namespace codec and store in Redis, optionally expiring after `ttl` seconds."""
         namespaced_key = self._full_key(key)
         try:
-            pickled = pickle.dumps(value)
-            encoded = base64.b64encode(pickled).decode("ascii")
-            self.client.set(namespaced_key, encoded)
+            self.client.set(namespaced_key, self._encode(value), **_ttl_kwargs(ttl))
             if debug:
                 Helpers.sysPrint(f"Set key:", namespaced_key)
         except Exception as e:
             Helpers.errPrint(f"Failed to set key {namespaced_key}: {e}", os.path.basename(__file__))
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve and decode a value from Redis."""
+        """Retrieve and decode a value from Redis with a single GET."""
         namespaced_key = self._full_key(key)
         try:
-            if not self.client.exists(namespaced_key):
-                return default
-
             raw = self.client.get(namespaced_key)
-            if raw is None:
-                return default
-
-            decoded = base64.b64decode(raw, validate=True)
-            value = pickle.loads(decoded)
-            return value
-        except (binascii.Error, pickle.UnpicklingError, Exception) as e:
+        except Exception as e:
             Helpers.errPrint(f"Failed to get key {namespaced_key}: {e}", os.path.basename(__file__))
             return default
+        return self._decode(raw, default, namespaced_key)
 
     def delete(self, key: str):
         """Delete a key from Redis."""
@@ -59,29 +147,127 @@ class MemStore:
         except Exception as e:
             Helpers.errPrint(f"Failed to delete key {namespaced_key}: {e}", os.path.basename(__file__))
 
-    def keys(self, pattern='*') -> List[str]:
-        """List all keys matching the pattern within the namespace."""
+    # === BATCH METHODS (one round-trip per call) ===
+
+    def mget(self, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """Retrieve many values with one MGET. Missing keys map to `default`."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = self.client.mget([self._full_key(k) for k in keys])
+        except Exception as e:
+            Helpers.errPrint(f"Failed to MGET {len(keys)} keys: {e}", os.path.basename(__file__))
+            return {k: default for k in keys}
+        return {k: self._decode(raw, default, k) for k, raw in zip(keys, raws)}
+
+    def mset(self, mapping: Dict[str, Any], ttl: Ttl = None):
+        """Store many values in one round-trip (MSET, or a pipeline of SETs when `ttl` is given)."""
+        if not mapping:
+            return
+        try:
+            if ttl is None:
+                self.client.mset({self._full_key(k): self._encode(v) for k, v in mapping.items()})
+            else:
+                with self.pipeline() as pipe:
+                    for k, v in mapping.items():
+                        pipe.set(k, v, ttl=ttl)
+            if debug:
+                Helpers.sysPrint(f"MSET keys:", len(mapping))
+        except Exception as e:
+            Helpers.errPrint(f"Failed to MSET {len(mapping)} keys: {e}", os.path.basename(__file__))
+
+    def mdelete(self, keys: Iterable[str]) -> int:
+        """Delete many keys with one DEL and return how many existed."""
+        keys = [self._full_key(k) for k in keys]
+        if not keys:
+            return 0
+        try:
+            return self.client.delete(*keys)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to delete {len(keys)} keys: {e}", os.path.basename(__file__))
+            return 0
+
+    def expire(self, key: str, ttl: Union[int, timedelta]) -> bool:
+        """Set a TTL on an existing key."""
         try:
-            full_pattern = f"{self.namespace}:{pattern}"
-            keys = self.client.keys(full_pattern)
-            return [key.decode('utf-8') for key in keys]
+            return bool(self.client.expire(self._full_key(key), ttl))
+        except Exception as e:
+            Helpers.errPrint(f"Failed to EXPIRE {key}: {e}", os.path.basename(__file__))
+            return False
+
+    @contextmanager
+    def pipeline(self, transaction: bool = False) -> Iterator[MemPipeline]:
+        """
+        Queue commands and send them in one round-trip when the block exits.
+        With `transaction=True` they run atomically inside MULTI/EXEC.
+        Decoded results are available as `pipe.results` after the block.
+
+            with store.pipeline() as pipe:
+                pipe.set("a", 1, ttl=60).get("b")
+            a_ok, b = pipe.results
+        """
+        pipe = MemPipeline(self, transaction=transaction)
+        try:
+            yield pipe
+            if len(pipe):
+                pipe.execute()
+        finally:
+            pipe.reset()
+
+    def iter_keys(self, pattern='*', count: int = 1000) -> Iterator[str]:
+        """
+        Lazily iterate keys matching the pattern within the namespace using SCAN,
+        fetching about `count` keys per round-trip without blocking Redis.
+        """
+        full_pattern = f"{self.namespace}:{pattern}"
+        for key in self.client.scan_iter(match=full_pattern, count=count):
+            yield key.decode('utf-8')
+
+    def iter_batches(self, pattern='*', count: int = 1000) -> Iterator[List[str]]:
+        """Iterate matching keys in lists of up to `count` keys."""
+        batch = []
+        for key in self.iter_keys(pattern, count=count):
+            batch.append(key)
+            if len(batch) >= count:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def iter_items(self, pattern='*', count: int = 1000) -> Iterator[tuple]:
+        """Iterate (key, value) pairs matching the pattern, decoding values fetched with one MGET per batch."""
+        for batch in self.iter_batches(pattern, count=count):
+            for key, raw in zip(batch, self.client.mget(batch)):
+                if raw is not None:
+                    yield key, self._decode(raw, None, key)
+
+    def keys(self, pattern='*', count: int = 1000) -> List[str]:
+        """List all keys matching the pattern within the namespace (SCAN-based)."""
+        try:
+            return list(self.iter_keys(pattern, count=count))
         except Exception as e:
             Helpers.errPrint(f"Failed to retrieve keys: {e}", os.path.basename(__file__))
             return []
 
-    def flush(self):
-        """Delete all keys within the namespace."""
+    def flush(self, pattern='*', batch_size: int = 1000) -> int:
+        """
+        Delete all keys within the namespace (optionally only those matching `pattern`).
+        Keys are scanned and removed with UNLINK in chunks of `batch_size`, so memory
+        stays bounded and Redis frees values in the background. Returns the number deleted.
+        """
+        deleted = 0
         try:
-            keys = self.keys()
-            if keys:
-                self.client.delete(*keys)
-                if debug:
-                    Helpers.print(f"Flushed {len(keys)} keys from namespace {self.namespace}.")
-            else:
-                if debug:
+            for batch in self.iter_batches(pattern, count=batch_size):
+                deleted += self.client.unlink(*batch)
+            if debug:
+                if deleted:
+                    Helpers.print(f"Flushed {deleted} keys from namespace {self.namespace}.")
+                else:
                     Helpers.print(f"No keys found in namespace {self.namespace} to flush.")
         except Exception as e:
             Helpers.errPrint(f"Failed to flush namespace {self.namespace}: {e}", os.path.basename(__file__))
+        return deleted
 
     def close(self):
         """Close the Redis connection."""
@@ -0,0 +1,324 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from kimera.helpers.Helpers import Helpers
+from kimera.store.MemStore import MemStore, Ttl
+
+debug = os.getenv("DEBUG_STORES",False)
+
+_MISSING = object()
+# L2 read failed (connection error or undecodable value): returned as the default, never cached
+_L2_ERROR = object()
+
+
+class NearCache:
+    """
+    Two-tier cache: an in-process LRU (L1) in front of a MemStore namespace (L2).
+
+    L1 entries are invalidated across processes through Redis pub/sub:
+    - tracking=True (Redis >= 6): server-assisted client-side caching. A dedicated
+      connection enables `CLIENT TRACKING ON BCAST PREFIX <namespace>:` redirected to
+      the listener, so any write to the namespace, from any client, evicts L1 entries.
+    - otherwise writes made through a NearCache publish the key on `channel`.
+
+    Reads that race with an invalidation are not cached, nothing is cached while the
+    listener is disconnected, and L1 is cleared whenever it (re)connects, so L1 never
+    serves values older than an observed write. A forked child starts its own listener
+    (and an empty L1) on first use.
+    Other MemStore methods (hash ops, scans, pipelines) pass straight through to L2.
+    """
+
+    TRACKING_CHANNEL = "__redis__:invalidate"
+    _fork_lock = threading.Lock()
+
+    def __init__(self, store: MemStore, max_size: int = 1024, ttl: float = 30.0,
+                 channel: str = "kimera:near-cache", tracking: bool = True):
+        self.store = store
+        self.max_size = max_size
+        self.ttl = ttl
+        self.channel = channel
+        self.tracking = tracking
+        self._prefix = f"{store.namespace}:"
+
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+        self._start_listener()
+
+    def _start_listener(self):
+        self._pid = os.getpid()
+        self._l1: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._tracking_active = False
+        # Set once the listener is subscribed; L1 is only filled while it is
+        self._listening = threading.Event()
+        self._stop = threading.Event()
+        self._listener = threading.Thread(target=self._listen, name=f"near-cache-{self.store.namespace}", daemon=True)
+        self._listener.start()
+
+    def _check_process(self):
+        """Threads do not survive fork: a child gets a fresh L1 and its own listener."""
+        if self._pid == os.getpid():
+            return
+        with NearCache._fork_lock:
+            if self._pid != os.getpid():
+                self._start_listener()
+
+    def __getattr__(self, name):
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    # === L1 ===
+
+    def _l1_get(self, key: str):
+        self._check_process()
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._l1[key]
+                self._stats["misses"] += 1
+                return _MISSING
+            self._l1.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def _l1_put(self, key: str, value: Any, generation: int):
+        with self._lock:
+            # An invalidation arrived while the value was in flight, it may be stale,
+            # or nothing would tell us about the next one
+            if generation != self._generation or not self._listening.is_set():
+                return
+            self._l1[key] = (time.monotonic() + self.ttl, value)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_size:
+                self._l1.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key (or everything) from this process's L1 only."""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            if key is None:
+                self._l1.clear()
+            else:
+                self._l1.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current L1 size."""
+        self._check_process()
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._l1),
+                "hit_ratio": self._stats["hits"] / total if total else 0.0,
+                "tracking": self._tracking_active,
+            }
+
+    # === READS ===
+
+    def _l2_decode(self, key: str, raw):
+        """Decoded L2 value, `_MISSING_VALUE` if absent, or `_L2_ERROR` if it cannot be decoded."""
+        if raw is None:
+            return _MISSING_VALUE
+        try:
+            return self.store.codec.decode(raw)
+        except Exception as e:
+            Helpers.errPrint(f"Failed to decode key {self._prefix}{key}: {e}", os.path.basename(__file__))
+            return _L2_ERROR
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._l1_get(key)
+        if value is not _MISSING:
+            return default if value is _MISSING_VALUE else value
+
+        generation = self._generation
+        # Read L2 directly: MemStore.get returns the default on errors too, which must not be cached as absent
+        try:
+            raw = self.store.client.get(self.store._full_key(key))
+        except Exception as e:
+            Helpers.errPrint(f"Failed to get key {self._prefix}{key}: {e}", os.path.basename(__file__))
+            return default
+        value = self._l2_decode(key, raw)
+        if value is _L2_ERROR:
+            return default
+        self._l1_put(key, value, generation)
+        return default if value is _MISSING_VALUE else value
+
+    def mget(self, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        keys = list(keys)
+        result = {}
+        pending = []
+        for key in keys:
+            value = self._l1_get(key)
+            if value is _MISSING:
+                pending.append(key)
+            else:
+                result[key] = default if value is _MISSING_VALUE else value
+
+        if pending:
+            generation = self._generation
+            try:
+                raws = self.store.client.mget([self.store._full_key(k) for k in pending])
+            except Exception as e:
+                Helpers.errPrint(f"Failed to MGET {len(pending)} keys: {e}", os.path.basename(__file__))
+                raws = None
+            for index, key in enumerate(pending):
+                value = _L2_ERROR if raws is None else self._l2_decode(key, raws[index])
+                if value is _L2_ERROR:
+                    result[key] = default
+                    continue
+                self._l1_put(key, value, generation)
+                result[key] = default if value is _MISSING_VALUE else value
+        return {key: result[key] for key in keys}
+
+    # === WRITES (write-through, then invalidate everywhere) ===
+
+    def _announce(self, key: str):
+        self._check_process()
+        self.invalidate(key)
+        if not self._tracking_active:
+            try:
+                self.store.client.publish(self.channel, self._prefix + key)
+            except Exception as e:
+                Helpers.errPrint(f"Failed to publish invalidation for {key}: {e}", os.path.basename(__file__))
+
+    def set(self, key: str, value: Any, ttl: Ttl = None):
+        self.store.set(key, value, ttl=ttl)
+        self._announce(key)
+
+    def mset(self, mapping: Dict[str, Any], ttl: Ttl = None):
+        self.store.mset(mapping, ttl=ttl)
+        for key in mapping:
+            self._announce(key)
+
+    def delete(self, key: str):
+        self.store.delete(key)
+        self._announce(key)
+
+    def mdelete(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        deleted = self.store.mdelete(keys)
+        for key in keys:
+            self._announce(key)
+        return deleted
+
+    def expire(self, key: str, ttl) -> bool:
+        result = self.store.expire(key, ttl)
+        self._announce(key)
+        return result
+
+    def flush(self, pattern='*', batch_size: int = 1000) -> int:
+        deleted = self.store.flush(pattern, batch_size=batch_size)
+        # "<namespace>:*" tells listeners to drop their whole L1
+        self._announce("*")
+        self.invalidate()
+        return deleted
+
+    def close(self):
+        self._stop.set()
+        if self._pid == os.getpid():
+            self._listener.join(timeout=3)
+        self.store.close()
+
+    # === INVALIDATION LISTENER ===
+
+    def _handle(self, data):
+        if data is None:
+            # Tracking sends a null payload on FLUSHALL/FLUSHDB
+            self.invalidate()
+            return
+        keys = data if isinstance(data, list) else [data]
+        for raw in keys:
+            key = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+            if key == self._prefix + "*":
+                self.invalidate()
+            elif key.startswith(self._prefix):
+                self.invalidate(key[len(self._prefix):])
+
+    def _connect(self):
+        """Open the listener connection and, when possible, redirect key tracking to it."""
+        client = self.store.client
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        tracker = None
+        self._tracking_active = False
+
+        if self.tracking:
+            try:
+                conn = client.connection_pool.make_connection()
+                conn.send_command("CLIENT", "ID")
+                client_id = conn.read_response()
+                pubsub.connection = conn
+                pubsub.subscribe(self.TRACKING_CHANNEL)
+
+                # Dedicated connection, never handed back to the pool with tracking on
+                tracker = client.connection_pool.make_connection()
+                tracker.send_command("CLIENT", "TRACKING", "ON", "REDIRECT", client_id,
+                                     "BCAST", "PREFIX", self._prefix)
+                tracker.read_response()
+                self._tracking_active = True
+            except Exception as e:
+                if debug:
+                    Helpers.warnPrint(f"Client tracking unavailable for {self._prefix}*, using channel: {e}")
+                self._close_tracker(tracker)
+                pubsub.close()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                tracker = None
+
+        pubsub.subscribe(self.channel)
+        # Anything may have changed while we were not listening
+        self.invalidate()
+        self._listening.set()
+        return pubsub, tracker
+
+    @staticmethod
+    def _close_tracker(tracker):
+        if tracker is None:
+            return
+        try:
+            tracker.send_command("CLIENT", "TRACKING", "OFF")
+            tracker.read_response()
+        except Exception:
+            pass
+        tracker.disconnect()
+
+    def _listen(self):
+        while not self._stop.is_set():
+            pubsub = tracker = None
+            try:
+                pubsub, tracker = self._connect()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self._handle(message["data"])
+            except Exception as e:
+                Helpers.errPrint(f"Near cache listener for {self._prefix}* failed: {e}", os.path.basename(__file__))
+                self._stop.wait(1.0)
+            finally:
+                self._listening.clear()
+                self._tracking_active = False
+                self.invalidate()
+                try:
+                    self._close_tracker(tracker)
+                    if pubsub is not None:
+                        pubsub.close()
+                except Exception:
+                    pass
+
+
+class _MissingValue:
+    """Cached marker for keys absent from L2 (negative caching)."""
+
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING_VALUE = _MissingValue()
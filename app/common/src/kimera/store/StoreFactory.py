@@ -1,4 +1,5 @@
 import os
+from typing import Union
 
 import yaml
 
@@ -14,6 +15,9 @@ from pydantic import BaseModel
 class MemConnection(BaseModel):
     uri: str
     namespaces: dict
+    async_namespaces: dict = {}
+    # store kwargs from stores.yaml; "namespaces" holds per-namespace overrides
+    options: dict = {}
 
 
 class StoreNotFound(Exception):
@@ -72,26 +76,49 @@ class StoreFactory:
         return cls._vector_store_instances[connection_name]
 
     @classmethod
-    def get_mem_store(cls, namespace="_root", connection_name="default", uri=None, **kwargs) -> 'MemStore':
+    def get_mem_store(cls, namespace="_root", connection_name="default", uri=None, asynchronous=None, **kwargs) -> Union['MemStore', 'AsyncMemStore']:
+        """
+        Get or create a Redis memory store instance by namespace.
+        `asynchronous=True` hands out an AsyncMemStore (redis.asyncio); when None the
+        namespace's `asynchronous` option from stores.yaml decides (sync by default).
+        Sync namespaces with a `near_cache` option are wrapped in a NearCache.
+        """
         from kimera.store.MemStore import MemStore
-        """Get or create a Redis memory store instance by namespace."""
+        from kimera.store.AsyncMemStore import AsyncMemStore
         if connection_name not in cls._mem_store_instances and uri is not None:
-            cls._mem_store_instances[connection_name] = MemConnection(uri=uri, namespaces=dict())
+            cls._mem_store_instances[connection_name] = MemConnection(uri=uri, namespaces=dict(), options=kwargs)
+        if connection_name not in cls._mem_store_instances:
+            raise StoreNotFound(f" {connection_name}:{namespace} does not exit or requires uri")
+
+        conn = cls._mem_store_instances[connection_name]
+        options = cls._mem_store_options(conn, namespace, kwargs)
+        if asynchronous is None:
+            asynchronous = bool(options.get("asynchronous", False))
+        instances = conn.async_namespaces if asynchronous else conn.namespaces
 
-        if namespace not in cls._mem_store_instances[connection_name].namespaces.keys():
-            conn = cls._mem_store_instances[connection_name]
-            cls._mem_store_instances[connection_name].namespaces[namespace] = MemStore(
+        if namespace not in instances:
+            store_cls = AsyncMemStore if asynchronous else MemStore
+            store = store_cls(
                 uri=conn.uri,
                 connection_name=connection_name,
                 namespace=namespace,
-                **kwargs
+                **options
             )
-        if (connection_name in cls._mem_store_instances and
-                namespace in cls._mem_store_instances[connection_name].namespaces.keys()):
+            near_cache = options.get("near_cache")
+            if near_cache and not asynchronous:
+                from kimera.store.NearCache import NearCache
+                store = NearCache(store, **(near_cache if isinstance(near_cache, dict) else {}))
+            instances[namespace] = store
+        return instances[namespace]
 
-            return cls._mem_store_instances[connection_name].namespaces.get(namespace)
-        else:
-            raise StoreNotFound(f" {connection_name}:{namespace} does not exit or requires uri")
+    @staticmethod
+    def _mem_store_options(conn: MemConnection, namespace: str, kwargs: dict) -> dict:
+        """Connection defaults, overridden by the namespace's entry, overridden by explicit kwargs."""
+        options = dict(conn.options)
+        per_namespace = options.pop("namespaces", None) or {}
+        options.update(per_namespace.get(namespace) or {})
+        options.update({k: v for k, v in kwargs.items() if k != "namespaces"})
+        return options
 
     @classmethod
     def get_fstore(cls, store_name, path=None, **kwargs) -> LocalFileStore:
@@ -41,4 +41,37 @@ class Resend:
         if email:
             return True
 
-        return False
\ No newline at end of file
+        return False
+
+    BATCH_LIMIT = 100
+
+    def mailer_send_batch(self, mailer: str, messages: List[Dict[str, str]]) -> List[bool]:
+        """
+        Send many emails through the batch endpoint, up to BATCH_LIMIT per request.
+        Each message is a dict with 'to', 'subject' and 'body'; returns one flag per message.
+        """
+        mailer = Resend._cfg.get(mailer, None)
+        if not mailer:
+            return [False] * len(messages)
+
+        sent = []
+        for start in range(0, len(messages), self.BATCH_LIMIT):
+            chunk = messages[start:start + self.BATCH_LIMIT]
+            params: List[resend.Emails.SendParams] = [
+                EmailParams(**{
+                    "from": mailer.from_,
+                    "to": [m["to"]] if isinstance(m["to"], str) else m["to"],
+                    "subject": m["subject"],
+                    "html": m["body"]
+                }).model_dump(by_alias=True, exclude={"attachments"})
+                for m in chunk
+            ]
+            try:
+                response = resend.Batch.send(params)
+                ok = bool(response and response.get("data"))
+            except Exception as e:
+                print(f"[RESEND] Batch of {len(chunk)} failed: {e}")
+                ok = False
+            sent.extend([ok] * len(chunk))
+
+        return sent
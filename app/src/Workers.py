@@ -1,7 +1,9 @@
+import asyncio
 import os
+import signal
 from kimera.comm.Intercom import Intercom, Message
-from src.comm_types import CommMessage
-from src.notifications import NotificationHandlers
+from kimera.comm.StreamIntercom import StreamIntercom
+from src.comm_types import CommRouter
 
 
 class Workers:
@@ -10,48 +12,77 @@ class Workers:
     Following Java standards for static utility classes.
     """
 
+    # Modules whose CommRouter.route handlers serve COMM_QUEUE
+    COMM_HANDLER_MODULES = (
+        "src.notifications.NotificationHandlers",
+    )
+
     @staticmethod
     async def comm_queue_worker(**kwargs):
         """
-        Worker coroutine for COMM_QUEUE Redis pub/sub.
+        Worker coroutine for COMM_QUEUE.
         Runs in a separate process via Spawner.
+
+        COMM_QUEUE_TRANSPORT selects the transport:
+        - "pubsub" (default): Redis pub/sub on the "comm" channel, one worker process.
+        - "streams": the "comm" Redis Stream read by consumer group COMM_QUEUE_GROUP,
+          so several worker processes share the load with at-least-once delivery.
         
         Args:
             **kwargs: Additional parameters (stop_event passed by Spawner)
         """
         # Note: stop_event is managed by Spawner's _graceful_task_wrapper
-        comm_queue = Intercom(os.getenv("COMM_QUEUE"))
-        
-        async def handle_message(data):
-            """
-            Handle incoming messages from COMM_QUEUE.
-            All messages must conform to CommMessage standard (scope, action, body).
-            """
-            try:
-                # Parse and validate the message
-                comm_msg = CommMessage(**data)
-                
-                print(f"[COMM_QUEUE] Received: scope={comm_msg.scope}, action={comm_msg.action}")
-                
-                # Route message based on scope
-                if comm_msg.scope == "notifications":
-                    # Dynamic handler resolution: action + "_handler"
-                    handler_name = f"{comm_msg.action}_handler"
-                    
-                    if hasattr(NotificationHandlers, handler_name):
-                        handler = getattr(NotificationHandlers, handler_name)
-                        await handler(comm_msg.body, comm_msg.metadata)
-                    else:
-                        print(f"[COMM_QUEUE] No handler found for action: {comm_msg.action}")
-                        print(f"[COMM_QUEUE] Expected handler method: {handler_name}")
-                
-                # Add more scope routing here as needed
-                # elif comm_msg.scope == "booking":
-                #     await handle_booking(comm_msg)
-                
-            except Exception as e:
-                print(f"[COMM_QUEUE] Error processing message: {e}")
-                print(f"[COMM_QUEUE] Invalid message data: {data}")
-        
-        # Subscribe to the communication queue channel
-        await comm_queue.subscribe("comm", handle_message)
+
+        # Build the (scope, action) -> handler table once; messages are validated from raw bytes
+        routes = CommRouter.load(*Workers.COMM_HANDLER_MODULES)
+        print(f"[COMM_QUEUE] Routes: {', '.join(routes)}")
+
+        # Handlers in flight per process; also the largest email batch (see NotificationHandlers)
+        concurrency = int(os.getenv("COMM_QUEUE_CONCURRENCY", 16))
+
+        if os.getenv("COMM_QUEUE_TRANSPORT", "pubsub") == "streams":
+            comm_queue = StreamIntercom(os.getenv("COMM_QUEUE"), maxlen=int(os.getenv("COMM_QUEUE_MAXLEN", 100000)))
+            await comm_queue.subscribe(
+                "comm",
+                CommRouter.dispatch,
+                group=os.getenv("COMM_QUEUE_GROUP", "comm-workers"),
+                count=int(os.getenv("COMM_QUEUE_BATCH", 100)),
+                max_deliveries=int(os.getenv("COMM_QUEUE_MAX_DELIVERIES", 5)),
+                concurrency=concurrency,
+                raw=True
+            )
+        else:
+            # Subscribe to the communication queue channel; handlers are independent, so run them concurrently
+            comm_queue = Intercom(os.getenv("COMM_QUEUE"))
+            await comm_queue.subscribe(
+                "comm",
+                CommRouter.dispatch,
+                concurrency=concurrency,
+                queue_size=int(os.getenv("COMM_QUEUE_SIZE", 1000)),
+                raw=True
+            )
+
+        # Spawner.stop terminates the process; shut down cleanly on SIGTERM as well as on cancel
+        loop = asyncio.get_running_loop()
+        stopping = asyncio.Event()
+        loop.add_signal_handler(signal.SIGTERM, stopping.set)
+
+        # Optional periodic report of per-route counters
+        stats_interval = float(os.getenv("COMM_QUEUE_STATS_INTERVAL", 0))
+        try:
+            while not stopping.is_set():
+                try:
+                    await asyncio.wait_for(stopping.wait(), stats_interval or None)
+                except asyncio.TimeoutError:
+                    print(f"[COMM_QUEUE] Stats: {CommRouter.stats()}")
+        finally:
+            print("[COMM_QUEUE] Shutting down")
+            # Stop taking messages and let in-flight handlers finish, then run the handlers' shutdown hooks
+            if isinstance(comm_queue, StreamIntercom):
+                await comm_queue.close()
+            else:
+                await comm_queue.close(drain=True)
+            await CommRouter.close()
+            loop.remove_signal_handler(signal.SIGTERM)
+            if stopping.is_set():
+                loop.stop()
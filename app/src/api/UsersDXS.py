@@ -1,37 +1,33 @@
+import json
+from typing import Optional
+
+from fastapi.responses import StreamingResponse
 from kimera.dxs.BaseDXS import BaseDXS
 from app.src.data.repos.UserRepo import UserRepo
 
 
 class UsersDXS(BaseDXS):
+    MAX_PAGE_SIZE = 1000
+
     def __init__(self, method_config: dict):
         super().__init__(method_config)
         self.user_repo = UserRepo()
 
-    async def list_users(self):
-        """Get all users from PostgreSQL database"""
+    async def list_users(self, cursor: Optional[int] = None, limit: int = 100):
+        """Get a page of users from PostgreSQL, ordered by id. Pass `next_cursor` back as `cursor` for the next page."""
         try:
             await self.user_repo.connect()
-            users = await self.user_repo.all()
-            
-            users_list = []
-            for user in users:
-                user_dict = {}
-                for column in user.__table__.columns:
-                    value = getattr(user, column.name)
-                    if hasattr(value, 'isoformat'):
-                        user_dict[column.name] = value.isoformat()
-                    else:
-                        user_dict[column.name] = value
-                
-                if 'password' in user_dict:
-                    del user_dict['password']
-                
-                users_list.append(user_dict)
-            
+            limit = max(1, min(limit, self.MAX_PAGE_SIZE))
+            rows, next_cursor = await self.user_repo.page(after=cursor, limit=limit)
+
+            serialize = self.user_repo.serializer(exclude=('password',))
+            users_list = [serialize(row) for row in rows]
+
             return {
                 "status": "success",
                 "count": len(users_list),
-                "users": users_list
+                "users": users_list,
+                "next_cursor": next_cursor
             }
         except Exception as e:
             import traceback
@@ -40,3 +36,15 @@ class UsersDXS(BaseDXS):
                 "message": str(e),
                 "traceback": traceback.format_exc()
             }
+
+    async def stream_users(self, batch_size: int = 1000):
+        """Stream all users as NDJSON (one JSON object per line) through a server-side cursor."""
+        await self.user_repo.connect()
+        batch_size = max(1, min(batch_size, self.MAX_PAGE_SIZE))
+        serialize = self.user_repo.serializer(exclude=('password',))
+
+        async def ndjson():
+            async for row in self.user_repo.stream(batch_size=batch_size):
+                yield json.dumps(serialize(row)) + "\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
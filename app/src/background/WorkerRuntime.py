@@ -0,0 +1,84 @@
+import asyncio
+import os
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+
+class WorkerRuntime:
+    """
+    Worker-lifetime asyncio runtime for Celery tasks.
+
+    One event loop per worker process runs forever on a daemon thread, so
+    async resources (SQLAlchemy engines, connection pools) stay warm between
+    tasks instead of being rebuilt by `asyncio.run` on every call.
+    Tasks submit coroutines with `WorkerRuntime.run(...)`.
+
+    Every task of the process shares that loop, so with a threaded pool
+    (`pool: threads`) a blocking call inside a coroutine stalls all of them:
+    run blocking I/O (e.g. mailer HTTP calls) with `asyncio.to_thread`.
+    """
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+    _pid: Optional[int] = None
+    _lock = threading.Lock()
+    _on_start: list = []
+
+    @classmethod
+    def on_start(cls, coro_fn: Callable[[], Awaitable[Any]]):
+        """Register a coroutine function run on the loop right after it starts (e.g. warming repos)."""
+        cls._on_start.append(coro_fn)
+        return coro_fn
+
+    @classmethod
+    def start(cls) -> asyncio.AbstractEventLoop:
+        """Start the loop thread for the current process; a no-op if it is already running."""
+        with cls._lock:
+            # A forked child inherits the attributes but not the thread
+            if cls._loop is not None and cls._pid == os.getpid() and cls._thread.is_alive():
+                return cls._loop
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=cls._run_loop, args=(loop,), name="worker-runtime", daemon=True)
+            thread.start()
+            cls._loop = loop
+            cls._thread = thread
+            cls._pid = os.getpid()
+
+        for coro_fn in cls._on_start:
+            try:
+                asyncio.run_coroutine_threadsafe(coro_fn(), loop).result()
+            except Exception as e:
+                print(f"[WorkerRuntime] Startup hook {getattr(coro_fn, '__name__', coro_fn)} failed: {e}")
+        return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    @classmethod
+    def run(cls, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the worker loop and block the calling task until it completes."""
+        loop = cls.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    @classmethod
+    def stop(cls, cleanup: Optional[Callable[[], Awaitable[Any]]] = None, timeout: float = 10):
+        """Run an optional cleanup coroutine, then stop the loop thread."""
+        with cls._lock:
+            loop, thread = cls._loop, cls._thread
+            if loop is None or cls._pid != os.getpid():
+                return
+            cls._loop = None
+            cls._thread = None
+            cls._pid = None
+
+        if cleanup is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+            except Exception as e:
+                print(f"[WorkerRuntime] Cleanup failed: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
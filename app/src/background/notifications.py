@@ -1,17 +1,57 @@
 import asyncio
 import os
-from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from kimera.Bootstrap import Bootstrap
+from kimera.process.Canvas import register_canvas_tasks
 from app.src.data.repos.UserRepo import UserRepo
 from app.src.data.repos.CommTemplateRepo import CommTemplateRepo
+from app.src.background.WorkerRuntime import WorkerRuntime
 from app.ext.mail.src.mailers.resend.Resend import Resend
 
 
 boot = Bootstrap()
-celery_app = Celery(
-    broker=boot.celery_broker,
-    backend=boot.celery_backend
-)
+# Pool, concurrency, prefetch, acks etc. come from the friend's `celery:` block in friends.yaml
+celery_app = boot.celery_worker_app("notifications")
+# Lets this worker run TaskManager chain/chord steps
+register_canvas_tasks(celery_app)
+
+# Repos live on the WorkerRuntime loop for the lifetime of the worker process
+_repos = {}
+_repos_lock = None
+
+
+@WorkerRuntime.on_start
+async def _get_repos():
+    """Create and connect the worker's repos once; they share the warm 'postgres' engine."""
+    global _repos_lock
+    if _repos:
+        return _repos
+    if _repos_lock is None:
+        _repos_lock = asyncio.Lock()
+    async with _repos_lock:
+        if not _repos:
+            user_repo = UserRepo()
+            await user_repo.connect()
+            # Same 'postgres' store as UserRepo, already connected above
+            _repos["users"] = user_repo
+            _repos["templates"] = CommTemplateRepo()
+    return _repos
+
+
+async def _close_repos():
+    if _repos:
+        await _repos["users"].db.close()
+        _repos.clear()
+
+
+@worker_process_init.connect
+def _start_runtime(**kwargs):
+    WorkerRuntime.start()
+
+
+@worker_process_shutdown.connect
+def _stop_runtime(**kwargs):
+    WorkerRuntime.stop(cleanup=_close_repos)
 
 
 @celery_app.task(name='app.src.background.notifications.send_user_notification')
@@ -27,13 +67,11 @@ def send_user_notification(user_id: int):
     """
     try:
         async def get_user_email():
-            user_repo = UserRepo()
-            await user_repo.connect()
+            user_repo = (await _get_repos())["users"]
             
-            user = await user_repo.get(user_id)
+            user_email = await user_repo.get_email(user_id)
             
-            if user:
-                user_email = user.email
+            if user_email:
                 print(f"=" * 80)
                 print(f"NOTIFICATION TASK - User ID: {user_id}")
                 print(f"User Email: {user_email}")
@@ -51,7 +89,7 @@ def send_user_notification(user_id: int):
                     "message": f"User with ID {user_id} not found"
                 }
         
-        result = asyncio.run(get_user_email())
+        result = WorkerRuntime.run(get_user_email())
         return result
         
     except Exception as e:
@@ -90,9 +128,8 @@ def send_email(user_id: str, template: str, template_data: dict, metadata: dict
             # Get language from template_data, default to 'en'
             language = template_data.get('language', 'en')
             
-            # Initialize template repository
-            template_repo = CommTemplateRepo()
-            await template_repo.connect()
+            # Template repository is shared across tasks in this worker
+            template_repo = (await _get_repos())["templates"]
             
             # Fetch template with localization
             email_template = await template_repo.get_template_by_key_and_language(
@@ -116,14 +153,11 @@ def send_email(user_id: str, template: str, template_data: dict, metadata: dict
             print(f"  - Content Preview (raw): {email_template['localization']['content'][:100]}...")
             
             # Render template by replacing {{variables}} with data
-            rendered_subject = template_repo.render_template(
-                email_template['localization']['subject'],
-                template_data
-            )
-            rendered_content = template_repo.render_template(
-                email_template['localization']['content'],
-                template_data
-            )
+            rendered = template_repo.render(email_template, template_data)
+            rendered_subject = rendered['subject']
+            rendered_content = rendered['content']
+            if rendered['missing']:
+                print(f"[SEND_EMAIL] WARNING: missing template variables: {', '.join(rendered['missing'])}")
             
             print(f"[SEND_EMAIL] Rendered template:")
             print(f"  - Subject: {rendered_subject}")
@@ -145,7 +179,9 @@ def send_email(user_id: str, template: str, template_data: dict, metadata: dict
                 print(f"[SEND_EMAIL] Sending email to {recipient_email}...")
                 
                 mailer = Resend()
-                success = mailer.mailer_send(
+                # Blocking HTTP call: off the shared WorkerRuntime loop, so other tasks keep running
+                success = await asyncio.to_thread(
+                    mailer.mailer_send,
                     mailer="default",
                     to=recipient_email,
                     subject=rendered_subject,
@@ -179,7 +215,7 @@ def send_email(user_id: str, template: str, template_data: dict, metadata: dict
                     "message": f"Failed to send email: {str(email_error)}"
                 }
         
-        result = asyncio.run(process_email())
+        result = WorkerRuntime.run(process_email())
         return result
         
     except Exception as e:
@@ -190,3 +226,100 @@ def send_email(user_id: str, template: str, template_data: dict, metadata: dict
             "status": "error",
             "message": str(e)
         }
+
+
+@celery_app.task(name='app.src.background.notifications.send_email_batch')
+def send_email_batch(items: list):
+    """
+    Background task to send a micro-batch of email notifications (see NotificationBatcher).
+
+    Items are grouped by (template, language) so each template is fetched and compiled
+    once per batch, then all rendered emails go out through the mailer's batch endpoint.
+
+    Args:
+        items: List of {"user_id", "template", "data", "metadata"} dicts, where data
+            is the template data (must include 'email', may include 'language')
+
+    Returns:
+        dict with status, sent/failed counts and one result per item (input order)
+    """
+    try:
+        print(f"[SEND_EMAIL_BATCH] Processing {len(items)} emails")
+
+        async def process_batch():
+            template_repo = (await _get_repos())["templates"]
+            results = [None] * len(items)
+            groups = {}
+            for index, item in enumerate(items):
+                template_data = item.get("data") or {}
+                key = (item.get("template"), template_data.get('language', 'en'))
+                groups.setdefault(key, []).append(index)
+
+            outgoing = []
+            for (template, language), indexes in groups.items():
+                email_template = await template_repo.get_template_by_key_and_language(
+                    key_name=template,
+                    language=language
+                )
+                if not email_template:
+                    print(f"[SEND_EMAIL_BATCH] Template '{template}' not found for language '{language}'")
+                    for index in indexes:
+                        results[index] = {"status": "error", "message": f"Template '{template}' not found"}
+                    continue
+
+                for index in indexes:
+                    item = items[index]
+                    template_data = item.get("data") or {}
+                    recipient_email = template_data.get('email')
+                    if not recipient_email:
+                        results[index] = {"status": "error", "message": "No recipient email provided"}
+                        continue
+
+                    rendered = template_repo.render(email_template, template_data)
+                    if rendered['missing']:
+                        print(f"[SEND_EMAIL_BATCH] WARNING: missing template variables for '{template}': "
+                              f"{', '.join(rendered['missing'])}")
+
+                    outgoing.append((index, {
+                        "to": recipient_email,
+                        "subject": rendered['subject'],
+                        "body": rendered['content']
+                    }))
+                    results[index] = {
+                        "status": "success",
+                        "user_id": item.get("user_id"),
+                        "template": template,
+                        "language": language,
+                        "template_id": email_template['id'],
+                        "recipient": recipient_email
+                    }
+
+            if outgoing:
+                # Blocking HTTP call: off the shared WorkerRuntime loop, so other tasks keep running
+                sent = await asyncio.to_thread(
+                    Resend().mailer_send_batch, "default", [message for _, message in outgoing]
+                )
+                for (index, _), success in zip(outgoing, sent):
+                    if not success:
+                        results[index] = {"status": "error", "message": "Failed to send email via Resend"}
+
+            failed = sum(1 for result in results if result["status"] != "success")
+            print(f"[SEND_EMAIL_BATCH] Sent {len(results) - failed}, failed {failed} "
+                  f"({len(groups)} template groups)")
+            return {
+                "status": "success" if not failed else "partial" if failed < len(results) else "error",
+                "sent": len(results) - failed,
+                "failed": failed,
+                "results": results
+            }
+
+        return WorkerRuntime.run(process_batch())
+
+    except Exception as e:
+        print(f"Error in send_email_batch: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {
+            "status": "error",
+            "message": str(e)
+        }
@@ -0,0 +1,139 @@
+import importlib
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from .CommMessage import CommMessage
+
+debug = os.getenv("DEBUG_COMM", False)
+
+Handler = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], Awaitable[Any]]
+
+
+class _Envelope(BaseModel):
+    """Intercom Message wrapper ({"type", "content", "channel"}) around a CommMessage."""
+    content: CommMessage
+
+
+class CommRouter:
+    """
+    (scope, action) -> handler table for COMM_QUEUE messages.
+
+    Handlers register with the `route` decorator when their module is imported;
+    `load()` imports the handler modules once at startup. Dispatch is then a single
+    dict lookup, with counters per route.
+
+        @staticmethod
+        @CommRouter.route("notifications", "email")
+        async def email_handler(body, metadata=None): ...
+    """
+
+    _routes: Dict[Tuple[str, str], Handler] = {}
+    _counters: Dict[Tuple[str, str], Dict[str, float]] = {}
+    _unrouted = 0
+    _invalid = 0
+    _on_close: List[Callable[[], Awaitable[Any]]] = []
+
+    @classmethod
+    def route(cls, scope: str, action: str):
+        """Decorator registering a coroutine function as the handler for (scope, action)."""
+        def decorator(func):
+            cls.add(scope, action, func)
+            return func
+        return decorator
+
+    @classmethod
+    def add(cls, scope: str, action: str, handler: Handler):
+        key = (scope, action)
+        if cls._routes.get(key, handler) is not handler:
+            raise ValueError(f"Duplicate COMM_QUEUE handler for {scope}.{action}")
+        cls._routes[key] = handler
+        cls._counters.setdefault(key, {"ok": 0, "failed": 0, "seconds": 0.0})
+
+    @classmethod
+    def on_close(cls, coro_fn: Callable[[], Awaitable[Any]]):
+        """Register a coroutine function run by `close()` when the worker shuts down (e.g. flushing batches)."""
+        cls._on_close.append(coro_fn)
+        return coro_fn
+
+    @classmethod
+    async def close(cls):
+        """Run the shutdown hooks; call after the transport has stopped delivering messages."""
+        for coro_fn in cls._on_close:
+            try:
+                await coro_fn()
+            except Exception as e:
+                print(f"[COMM_QUEUE] Shutdown hook {getattr(coro_fn, '__name__', coro_fn)} failed: {e}")
+
+    @classmethod
+    def load(cls, *modules: str):
+        """Import handler modules so their routes register. Returns the registered routes."""
+        for module in modules:
+            importlib.import_module(module)
+        return sorted(f"{scope}.{action}" for scope, action in cls._routes)
+
+    @staticmethod
+    def parse(data) -> CommMessage:
+        """
+        Validate a message straight from JSON bytes/str (Intercom envelope or bare CommMessage),
+        or from an already decoded dict.
+        """
+        if isinstance(data, CommMessage):
+            return data
+        if isinstance(data, (bytes, bytearray, str)):
+            try:
+                return _Envelope.model_validate_json(data).content
+            except ValidationError:
+                return CommMessage.model_validate_json(data)
+        return CommMessage.model_validate(data)
+
+    @classmethod
+    async def dispatch(cls, data) -> bool:
+        """
+        Route one message. Returns False for invalid or unrouted messages (logged, not raised);
+        handler exceptions propagate so the transport can log them or leave them for redelivery.
+        """
+        try:
+            message = cls.parse(data)
+        except ValidationError as e:
+            cls._invalid += 1
+            print(f"[COMM_QUEUE] Invalid message: {e}")
+            print(f"[COMM_QUEUE] Invalid message data: {data}")
+            return False
+
+        key = (message.scope, message.action)
+        handler = cls._routes.get(key)
+        if handler is None:
+            cls._unrouted += 1
+            print(f"[COMM_QUEUE] No handler found for {message.scope}.{message.action}")
+            return False
+
+        if debug:
+            print(f"[COMM_QUEUE] Received: scope={message.scope}, action={message.action}")
+
+        counters = cls._counters[key]
+        start = time.perf_counter()
+        try:
+            await handler(message.body, message.metadata)
+            counters["ok"] += 1
+            return True
+        except Exception:
+            counters["failed"] += 1
+            raise
+        finally:
+            counters["seconds"] += time.perf_counter() - start
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Per-route ok/failed counts and average handler time, plus unrouted/invalid totals."""
+        routes = {}
+        for (scope, action), counters in cls._counters.items():
+            calls = counters["ok"] + counters["failed"]
+            routes[f"{scope}.{action}"] = {
+                "ok": counters["ok"],
+                "failed": counters["failed"],
+                "avg_ms": round(counters["seconds"] * 1000 / calls, 3) if calls else 0.0,
+            }
+        return {"routes": routes, "unrouted": cls._unrouted, "invalid": cls._invalid}
@@ -1,3 +1,4 @@
 from .CommMessage import CommMessage
+from .CommRouter import CommRouter
 
-__all__ = ['CommMessage']
+__all__ = ['CommMessage', 'CommRouter']
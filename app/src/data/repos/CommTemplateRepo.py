@@ -1,14 +1,81 @@
-from typing import Optional, Dict, Any
+import json
+import os
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Set, List
 from kimera.store.StoreFactory import StoreFactory
 from sqlalchemy import text
 
 
+class CompiledTemplate:
+    """
+    Template string pre-split into literal segments and {{variable}} placeholders.
+    Rendering joins the segments without re-scanning the template.
+    """
+
+    __slots__ = ('literals', 'placeholders', 'variables')
+
+    _PLACEHOLDER = re.compile(r'\{\{([^}]+)\}\}')
+
+    def __init__(self, template_string: str):
+        literals: List[str] = []
+        placeholders: List[Tuple[str, str]] = []
+        pos = 0
+        for match in self._PLACEHOLDER.finditer(template_string):
+            literals.append(template_string[pos:match.start()])
+            placeholders.append((match.group(1).strip(), match.group(0)))
+            pos = match.end()
+        literals.append(template_string[pos:])
+
+        self.literals = tuple(literals)
+        self.placeholders = tuple(placeholders)
+        self.variables = frozenset(name for name, _ in placeholders)
+
+    def render(self, data: Dict[str, Any]) -> str:
+        """Substitute placeholders with values from data, leaving unknown ones untouched."""
+        if not self.placeholders:
+            return self.literals[0]
+        parts = [self.literals[0]]
+        for (name, raw), literal in zip(self.placeholders, self.literals[1:]):
+            parts.append(str(data[name]) if name in data else raw)
+            parts.append(literal)
+        return "".join(parts)
+
+
 class CommTemplateRepo:
     """
     Repository for retrieving communication templates with localizations.
     """
     
+    # Requested localization first, English as fallback, in a single round-trip
+    _TEMPLATE_QUERY = text("""
+        SELECT
+            ct.id,
+            ct.template_type,
+            ct.key_name,
+            ct.variables,
+            l.id,
+            ctl.name,
+            ctl.subject,
+            ctl.content,
+            l.locale_short_name,
+            l.rtl
+        FROM comm_templates ct
+        JOIN comm_templates_localizations ctl ON ctl.template_id = ct.id
+        JOIN locales l ON l.id = ctl.locale_id
+        WHERE ct.key_name = :key_name
+          AND l.locale_short_name IN (:language, 'en')
+        ORDER BY (l.locale_short_name = :language) DESC
+        LIMIT 1
+    """)
+
+    # Process-wide template cache shared by every repo instance
+    _cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+    _cache_ttl: float = float(os.getenv("TEMPLATE_CACHE_TTL", 300))
+    _cache_max: int = int(os.getenv("TEMPLATE_CACHE_SIZE", 512))
+    
     def __init__(self):
         """
         Initialize the repository with database store.
@@ -18,7 +85,57 @@ class CommTemplateRepo:
     async def connect(self):
         """Connect to the database."""
         await self.db.connect()
+
+    @classmethod
+    def _cache_get(cls, cache_key: Tuple[str, str]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        entry = cls._cache.get(cache_key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires < time.monotonic():
+            cls._cache.pop(cache_key, None)
+            return False, None
+        cls._cache.move_to_end(cache_key)
+        return True, value
+
+    @classmethod
+    def _cache_put(cls, cache_key: Tuple[str, str], value: Optional[Dict[str, Any]]):
+        if cls._cache_ttl <= 0:
+            return
+        cls._cache[cache_key] = (time.monotonic() + cls._cache_ttl, value)
+        cls._cache.move_to_end(cache_key)
+        while len(cls._cache) > cls._cache_max:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    def invalidate_cache(cls, key_name: Optional[str] = None, language: Optional[str] = None):
+        """
+        Drop cached templates.
+        
+        Args:
+            key_name: Only drop entries for this template key (all templates if None)
+            language: Only drop entries for this language (all languages if None)
+        """
+        if key_name is None and language is None:
+            cls._cache.clear()
+            return
+        for cache_key, (_, value) in list(cls._cache.items()):
+            if key_name is not None and cache_key[0] != key_name:
+                continue
+            # Fallback entries hold another locale's localization, match on both
+            served = value['localization']['locale_short_name'] if value else None
+            if language is None or language in (cache_key[1], served):
+                cls._cache.pop(cache_key, None)
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile_template(template_string: str) -> "CompiledTemplate":
+        """
+        Parse {{variable}} placeholders once into a reusable CompiledTemplate.
+        Compiled forms are memoized per template string.
+        """
+        return CompiledTemplate(template_string)
+
     @staticmethod
     def render_template(template_string: str, data: Dict[str, Any]) -> str:
         """
@@ -31,11 +148,60 @@ class CommTemplateRepo:
         Returns:
             Rendered template string with variables replaced
         """
-        def replace_var(match):
-            var_name = match.group(1).strip()
-            return str(data.get(var_name, match.group(0)))
+        return CommTemplateRepo.compile_template(template_string).render(data)
+
+    @staticmethod
+    def render(template: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render subject and content of a template returned by get_template_by_key_and_language.
+        
+        Args:
+            template: Template dictionary (uses its precompiled forms when present)
+            data: Dictionary with variable names as keys and replacement values as values
         
-        return re.sub(r'\{\{([^}]+)\}\}', replace_var, template_string)
+        Returns:
+            Dictionary with rendered 'subject' and 'content', and 'missing' listing
+            declared template variables absent from data
+        """
+        compiled = template.get('compiled')
+        if compiled is None:
+            localization = template['localization']
+            compiled = {
+                'subject': CommTemplateRepo.compile_template(localization['subject'] or ""),
+                'content': CommTemplateRepo.compile_template(localization['content'] or "")
+            }
+
+        declared = CommTemplateRepo._declared_variables(template.get('variables'))
+        if not declared:
+            declared = compiled['subject'].variables | compiled['content'].variables
+
+        return {
+            'subject': compiled['subject'].render(data),
+            'content': compiled['content'].render(data),
+            'missing': sorted(v for v in declared if v not in data)
+        }
+
+    @staticmethod
+    def _declared_variables(variables: Any) -> Set[str]:
+        """Normalize the comm_templates.variables column (list, dict, JSON or CSV string)."""
+        if not variables:
+            return set()
+        if isinstance(variables, str):
+            try:
+                variables = json.loads(variables)
+            except ValueError:
+                return {v.strip() for v in variables.split(",") if v.strip()}
+        if isinstance(variables, dict):
+            return {str(k) for k in variables.keys()}
+        if isinstance(variables, (list, tuple, set)):
+            names = set()
+            for v in variables:
+                if isinstance(v, dict):
+                    v = v.get('name')
+                if v:
+                    names.add(str(v).strip())
+            return names
+        return set()
     
     async def get_template_by_key_and_language(
         self, 
@@ -44,6 +210,9 @@ class CommTemplateRepo:
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieve a communication template by key_name and language.
+        Falls back to English when the locale or its localization is missing.
+        Results (including fallbacks and misses) are served from an in-process
+        TTL/LRU cache keyed by (key_name, language).
         
         Args:
             key_name: The template key (e.g., 'password_reset')
@@ -52,79 +221,53 @@ class CommTemplateRepo:
         Returns:
             Dictionary containing template data with localization, or None if not found
         """
+        cache_key = (key_name, language)
+        hit, cached = self._cache_get(cache_key)
+        if hit:
+            return cached
+
         try:
             async with self.db.session() as session:
-                # First, get the locale ID from the short name
-                locale_query = text("SELECT id FROM locales WHERE locale_short_name = :language")
-                locale_result = await session.execute(locale_query, {"language": language})
-                locale_row = locale_result.fetchone()
-                
-                if not locale_row:
-                    print(f"[CommTemplateRepo] Locale '{language}' not found")
-                    if language != 'en':
-                        return await self.get_template_by_key_and_language(key_name, 'en')
-                    return None
-                
-                locale_id = locale_row[0]
-                print(f"[CommTemplateRepo] Locale '{language}' found with ID: {locale_id}")
-                
-                # Get template by key_name
-                template_query = text("SELECT id, template_type, key_name, variables FROM comm_templates WHERE key_name = :key_name")
-                template_result = await session.execute(template_query, {"key_name": key_name})
-                template_row = template_result.fetchone()
-                
-                if not template_row:
-                    print(f"[CommTemplateRepo] Template '{key_name}' not found")
-                    return None
-                
-                template_id, template_type, template_key, variables = template_row
-                print(f"[CommTemplateRepo] Template '{key_name}' found with ID: {template_id}")
-                
-                # Get localization for this template and locale
-                localization_query = text("""
-                    SELECT name, subject, content 
-                    FROM comm_templates_localizations 
-                    WHERE template_id = :template_id AND locale_id = :locale_id
-                """)
-                localization_result = await session.execute(localization_query, {"template_id": template_id, "locale_id": locale_id})
-                localization_row = localization_result.fetchone()
-                
-                if not localization_row:
-                    # Fallback to English if requested language not found
-                    if language != 'en':
-                        print(f"[CommTemplateRepo] Localization not found for template '{key_name}' in language '{language}', falling back to English")
-                        return await self.get_template_by_key_and_language(key_name, 'en')
-                    
-                    print(f"[CommTemplateRepo] Localization not found for template '{key_name}' in language '{language}'")
-                    return None
-                
-                name, subject, content = localization_row
-                print(f"[CommTemplateRepo] Localization found for template '{key_name}'")
-                
-                # Get locale info for rtl
-                locale_info_query = text("SELECT locale_short_name, rtl FROM locales WHERE id = :locale_id")
-                locale_info_result = await session.execute(locale_info_query, {"locale_id": locale_id})
-                locale_info_row = locale_info_result.fetchone()
-                locale_short_name, rtl = locale_info_row
-                
-                return {
-                    'id': template_id,
-                    'template_type': template_type,
-                    'key_name': template_key,
-                    'variables': variables,
-                    'localization': {
-                        'locale_id': locale_id,
-                        'name': name,
-                        'subject': subject,
-                        'content': content,
-                        'locale_short_name': locale_short_name,
-                        'rtl': rtl
-                    }
-                }
-            
+                result = await session.execute(
+                    self._TEMPLATE_QUERY,
+                    {"key_name": key_name, "language": language}
+                )
+                row = result.fetchone()
         except Exception as e:
             print(f"[CommTemplateRepo] Error fetching template: {e}")
             return None
+
+        if not row:
+            print(f"[CommTemplateRepo] Template '{key_name}' not found for language '{language}'")
+            self._cache_put(cache_key, None)
+            return None
+
+        (template_id, template_type, template_key, variables,
+         locale_id, name, subject, content, locale_short_name, rtl) = row
+
+        if locale_short_name != language:
+            print(f"[CommTemplateRepo] Localization not found for template '{key_name}' in language '{language}', falling back to English")
+
+        template = {
+            'id': template_id,
+            'template_type': template_type,
+            'key_name': template_key,
+            'variables': variables,
+            'localization': {
+                'locale_id': locale_id,
+                'name': name,
+                'subject': subject,
+                'content': content,
+                'locale_short_name': locale_short_name,
+                'rtl': rtl
+            }
+        }
+        template['compiled'] = {
+            'subject': self.compile_template(subject or ""),
+            'content': self.compile_template(content or "")
+        }
+        self._cache_put(cache_key, template)
+        return template
     
     async def get_template_by_key(self, key_name: str) -> Optional[Dict[str, Any]]:
         """
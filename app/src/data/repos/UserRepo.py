@@ -13,10 +13,17 @@ class UserRepo(AutoWireRepo):
         self.store_name = "postgres"
         super().__init__()
     
-    async def get_by_email(self, email: str) -> Optional[any]:
-        """Get user by email address"""
+    async def get_by_email(self, email: str, columns: Optional[List[str]] = None) -> Optional[any]:
+        """Get user by email address (a dict of `columns` when given, else the ORM object)"""
+        if columns:
+            return await self.select_one(columns=columns, email=email)
         users = await self.find(email=email)
         return users[0] if users else None
+
+    async def get_email(self, user_id: int) -> Optional[str]:
+        """Get only the email address of a user"""
+        row = await self.select_one(columns=["email"], mappings=False, id=user_id)
+        return row[0] if row else None
     
     async def get_active_users(self) -> List[any]:
         """Get all active users"""
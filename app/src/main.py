@@ -29,12 +29,17 @@ async def start_services():
     if os.getenv("COMM_QUEUE"):
         Helpers.sysPrint("COMM_QUEUE", "STARTING")
         spawner = Spawner()
-        spawner.loop(
-            name="comm-queue-listener",
-            coro=Workers.comm_queue_worker,
-            params={},
-            perpetual=True
-        )
+        # Only the streams transport can share the queue between processes
+        workers = 1
+        if os.getenv("COMM_QUEUE_TRANSPORT", "pubsub") == "streams":
+            workers = max(1, int(os.getenv("COMM_QUEUE_WORKERS", 1)))
+        for i in range(workers):
+            spawner.loop(
+                name="comm-queue-listener" if workers == 1 else f"comm-queue-listener-{i}",
+                coro=Workers.comm_queue_worker,
+                params={},
+                perpetual=True
+            )
         Helpers.sysPrint("COMM_QUEUE", "STARTED")
     # Start Redis subscription
     # Spawner().start("roco", jolly_run)
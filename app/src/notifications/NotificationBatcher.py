@@ -0,0 +1,96 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from kimera.process.TaskManager import TaskManager
+
+
+class NotificationBatcher:
+    """
+    Micro-batching stage in front of Celery.
+
+    Items accumulate until `max_items` are buffered or `max_wait_ms` has passed since
+    the first one, then go out as a single `task_name` task whose only argument is the
+    list of items. One broker round-trip replaces one per notification.
+
+    `add` returns a future that resolves to the task id once the item's batch has been
+    accepted by the broker, or raises the dispatch error. Await it before acknowledging
+    the message that produced the item. Call `flush()` on shutdown.
+
+    Because each caller waits for its batch, a batch can never hold more items than the
+    callers that can be waiting at once (`max_waiting`, the transport's handler
+    concurrency). `max_items` is clamped to it, so full batches go out immediately
+    instead of always waiting `max_wait_ms`; raise the concurrency to get larger batches.
+    """
+
+    def __init__(self, friend: str, task_name: str, max_items: Optional[int] = None,
+                 max_wait_ms: Optional[float] = None, max_waiting: Optional[int] = None):
+        self.friend = friend
+        self.task_name = task_name
+        self.max_items = max_items or int(os.getenv("NOTIFY_BATCH_SIZE", 100))
+        if max_waiting is not None:
+            if max_waiting < 1:
+                raise ValueError(f"max_waiting must be at least 1, got {max_waiting}")
+            if max_waiting < self.max_items:
+                print(f"[NOTIFY_BATCH] {task_name}: batch size {self.max_items} is above the {max_waiting} "
+                      f"handlers that can wait at once, using batches of {max_waiting}")
+                self.max_items = max_waiting
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else float(os.getenv("NOTIFY_BATCH_MS", 50))
+        self._items: List[Dict[str, Any]] = []
+        self._futures: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._pending = set()
+
+    def add(self, item: Dict[str, Any]) -> asyncio.Future:
+        """Buffer one item; dispatches immediately when the batch is full. See the class docstring for the future."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        if len(self._items) >= self.max_items:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._dispatch)
+        return future
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        items, self._items = self._items, []
+        futures, self._futures = self._futures, []
+        task = asyncio.create_task(self._send(items, futures))
+        # Keep a reference until done so the task is not garbage collected
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _send(self, items: List[Dict[str, Any]], futures: List[asyncio.Future]):
+        try:
+            task_id = await TaskManager().send_async(
+                task_name=self.task_name,
+                friend=self.friend,
+                args=[items],
+                ignore_result=True
+            )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            print(f"[NOTIFY_BATCH] Failed to queue {self.task_name} with {len(items)} items: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        print(f"[NOTIFY_BATCH] Queued {self.task_name} with {len(items)} items")
+        for future in futures:
+            if not future.done():
+                future.set_result(task_id)
+
+    async def flush(self):
+        """Dispatch whatever is buffered and wait for all in-flight dispatches (errors go to the items' futures)."""
+        self._dispatch()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
@@ -1,18 +1,31 @@
+import os
 from typing import Dict, Any, Optional
 from kimera.process.TaskManager import TaskManager
+from src.comm_types import CommRouter
+from .NotificationBatcher import NotificationBatcher
 
 
 class NotificationHandlers:
     """
     Static handler methods for notification actions.
-    Each handler method follows the naming convention: {action}_handler
+    Each handler is registered with CommRouter as ("notifications", action)
+    and follows the naming convention: {action}_handler
     
     All handlers receive:
     - body: Dict[str, Any] (mandatory) - The message payload
     - metadata: Optional[Dict[str, Any]] (optional) - Additional context
     """
+
+    # Emails are dispatched in micro-batches (NOTIFY_BATCH_SIZE items / NOTIFY_BATCH_MS). Each
+    # handler waits for its batch, so batches are capped at the comm worker's handler concurrency
+    email_batcher = NotificationBatcher(
+        friend="notifications",
+        task_name="send_email_batch",
+        max_waiting=int(os.getenv("COMM_QUEUE_CONCURRENCY", 16))
+    )
     
     @staticmethod
+    @CommRouter.route("notifications", "email")
     async def email_handler(body: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
         """
         Handle email notification requests.
@@ -44,25 +57,32 @@ class NotificationHandlers:
             print(f"[EMAIL_HANDLER] Processing email for user_id={user_id}, template={template}")
             print(f"[EMAIL_HANDLER] Template data: {template_data}")
             
-            # Get TaskManager singleton
-            task_manager = TaskManager()
-            
-            # Queue the email task asynchronously via Celery
-            await task_manager.send_async(
-                task_name="send_email",
-                friend="notifications",
-                args=[user_id, template, template_data],
-                kwargs={"metadata": metadata}
-            )
+            # Buffer for the next send_email_batch task (one Celery task per micro-batch) and
+            # wait until that task is queued, so the message is only acked once the email is safe
+            await NotificationHandlers.email_batcher.add({
+                "user_id": user_id,
+                "template": template,
+                "data": template_data,
+                "metadata": metadata
+            })
             
-            print(f"[EMAIL_HANDLER] Email task queued successfully for user_id={user_id}")
+            print(f"[EMAIL_HANDLER] Email batched for user_id={user_id}")
             
         except Exception as e:
             print(f"[EMAIL_HANDLER] Error: {e}")
             if metadata:
                 print(f"[EMAIL_HANDLER] Metadata: {metadata}")
+            # Not queued: let the transport see the failure (stream entries stay pending for redelivery)
+            raise
     
     @staticmethod
+    @CommRouter.on_close
+    async def flush_batches():
+        """Queue any emails still buffered when the comm worker shuts down."""
+        await NotificationHandlers.email_batcher.flush()
+
+    @staticmethod
+    @CommRouter.route("notifications", "whatsapp")
     async def whatsapp_handler(body: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
         """
         Handle WhatsApp notification requests.
@@ -101,7 +121,8 @@ class NotificationHandlers:
                 task_name="send_whatsapp",
                 friend="notifications",
                 args=[user_id, template, template_data],
-                kwargs={"metadata": metadata}
+                kwargs={"metadata": metadata},
+                ignore_result=True
             )
             
             print(f"[WHATSAPP_HANDLER] WhatsApp task queued successfully for user_id={user_id}")
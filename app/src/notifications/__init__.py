@@ -1,3 +1,4 @@
+from .NotificationBatcher import NotificationBatcher
 from .NotificationHandlers import NotificationHandlers
 
-__all__ = ['NotificationHandlers']
+__all__ = ['NotificationBatcher', 'NotificationHandlers']